@@ -0,0 +1,231 @@
+"""End-to-end benchmarks of every CLI command against the fake server.
+
+Each scenario invokes the Typer app from `src/main.py` in a fresh
+interpreter, pointed at `fake_server.py` with its own config dir. It runs
+once with empty caches (cold) and once more on the caches the first run
+left behind (warm). For each run it reports wall time, HTTP requests,
+response bytes and peak RSS, and compares them to the baselines in
+`benchmarks/baselines/e2e.json`:
+
+    python benchmarks/e2e.py                    # compare against baselines
+    python benchmarks/e2e.py --update-baseline  # record new baselines
+    python benchmarks/e2e.py -k show -k submit  # only some scenarios
+
+Request and byte counts are deterministic and any increase fails the run;
+wall time and memory fail only beyond a tolerance, since they are noisy.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_FILE = os.path.join(ROOT, "benchmarks", "baselines", "e2e.json")
+
+SOLUTION = (
+    "class Solution:\n    def twoSum(self, nums, target):\n        return [0, 1]\n"
+)
+
+SCENARIOS = {
+    "show": ["show", "1"],
+    "list": ["list"],
+    "daily": ["daily", "--no-editor"],
+    "profile": ["profile"],
+    "solutions": ["solutions", "two-sum"],
+    "edit": ["edit", "two-sum", "python3", "--no-open"],
+    "test": ["test", "two-sum", "two-sum.py"],
+    "submit": ["submit", "1", "two-sum.py", "--force"],
+}
+
+# Allowed growth over the baseline before a metric counts as a regression
+TOLERANCE = {"requests": 0.0, "bytes": 0.05, "wall_ms": 0.5, "peak_mb": 0.2}
+# Absolute growth always allowed, so scenarios that take a few milliseconds
+# do not fail on scheduler noise
+ABSOLUTE_FLOOR = {"wall_ms": 25}
+
+
+def run_child(args):
+    """Invoke the CLI in this process and print its metrics as JSON"""
+    from problem_list_parse import peak_rss_kb
+    from typer.testing import CliRunner
+
+    started = time.perf_counter()
+    from src.main import app
+    from src.server.timings import get_spans, keep_spans
+
+    keep_spans()
+
+    result = CliRunner().invoke(app, args)
+    wall = time.perf_counter() - started
+
+    requests = [s for s in get_spans() if s.name == "http.request"]
+    print(
+        json.dumps(
+            {
+                "exit_code": result.exit_code,
+                "wall_ms": wall * 1000,
+                "requests": len(requests),
+                "bytes": sum(s.attrs.get("bytes") or 0 for s in requests),
+                "peak_mb": peak_rss_kb() / 1024,
+                "output": result.output[-2000:],
+            }
+        )
+    )
+
+
+def run_scenario(name, server_url, config_dir, workdir):
+    env = dict(
+        os.environ,
+        LEETCODE_BASE_URL=server_url,
+        XDG_CONFIG_HOME=config_dir,
+        HOME=config_dir,
+        PYTHONPATH=os.pathsep.join([ROOT, os.path.dirname(os.path.abspath(__file__))]),
+        COLUMNS="100",
+    )
+    env.pop("LC_TRACE", None)
+    output = subprocess.check_output(
+        [sys.executable, os.path.abspath(__file__), "--child", *SCENARIOS[name]],
+        cwd=workdir,
+        env=env,
+    )
+    metrics = json.loads(output.decode("utf-8").strip().splitlines()[-1])
+    if metrics["exit_code"] != 0:
+        raise RuntimeError(
+            f"{name} exited with {metrics['exit_code']}:\n{metrics['output']}"
+        )
+    return metrics
+
+
+def prepare_config_dir(server_url):
+    """A config dir holding only a fresh saved session"""
+    config_dir = tempfile.mkdtemp(prefix="lc-bench-")
+    env = dict(os.environ, XDG_CONFIG_HOME=config_dir, HOME=config_dir)
+    env["LEETCODE_BASE_URL"] = server_url
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-c",
+            "from src.server.session_manager import SessionManager; "
+            "SessionManager().save_session('csrf', 'session', 'benchmark')",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+    return config_dir
+
+
+def measure(name, server_url, repeat):
+    """Median cold and warm metrics of a scenario over `repeat` runs"""
+    runs = {"cold": [], "warm": []}
+    for _ in range(repeat):
+        config_dir = prepare_config_dir(server_url)
+        workdir = os.path.join(config_dir, "work")
+        os.makedirs(workdir)
+        with open(os.path.join(workdir, "two-sum.py"), "w") as f:
+            f.write(SOLUTION)
+        try:
+            for phase in ("cold", "warm"):
+                runs[phase].append(run_scenario(name, server_url, config_dir, workdir))
+        finally:
+            shutil.rmtree(config_dir, ignore_errors=True)
+
+    return {
+        phase: {
+            metric: round(statistics.median(run[metric] for run in results), 1)
+            for metric in TOLERANCE
+        }
+        for phase, results in runs.items()
+    }
+
+
+def regressions(current, baseline):
+    found = []
+    for metric, tolerance in TOLERANCE.items():
+        limit = max(
+            baseline[metric] * (1 + tolerance),
+            baseline[metric] + ABSOLUTE_FLOOR.get(metric, 0),
+        )
+        if current[metric] > limit:
+            found.append(f"{metric} {baseline[metric]:g} -> {current[metric]:g}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="only", action="append", choices=list(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=20, help="Milliseconds")
+    parser.add_argument("--judge-delay", type=float, default=0.3, help="Seconds")
+    parser.add_argument("--problems", type=int, default=3500)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--child", nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        return run_child(args.child)
+
+    from fake_server import FakeLeetCode
+
+    settings = {
+        "latency_ms": args.latency,
+        "judge_delay": args.judge_delay,
+        "problems": args.problems,
+    }
+    baselines = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE) as f:
+            baselines = json.load(f)
+    if baselines and baselines.get("settings") != settings:
+        print("Baselines were recorded with other settings; not comparing")
+        baselines = {}
+
+    results = {}
+    failed = []
+    server = FakeLeetCode(
+        latency=args.latency / 1000,
+        judge_delay=args.judge_delay,
+        problems=args.problems,
+    )
+    with server:
+        header = (
+            f"{'scenario':<16}{'wall':>10}{'requests':>10}{'bytes':>10}{'peak':>10}"
+        )
+        print(header)
+        for name in args.only or SCENARIOS:
+            results[name] = measure(name, server.url, args.repeat)
+            for phase, metrics in results[name].items():
+                row = (
+                    f"{name + ' ' + phase:<16}"
+                    f"{metrics['wall_ms']:>8.0f}ms{metrics['requests']:>10.0f}"
+                    f"{metrics['bytes'] / 1024:>8.1f}KB{metrics['peak_mb']:>8.1f}MB"
+                )
+                baseline = baselines.get("scenarios", {}).get(name, {}).get(phase)
+                if baseline:
+                    found = regressions(metrics, baseline)
+                    if found:
+                        failed.append(f"{name} {phase}: " + ", ".join(found))
+                        row += "  REGRESSED"
+                print(row)
+
+    if args.update_baseline:
+        scenarios = dict(baselines.get("scenarios", {}), **results)
+        os.makedirs(os.path.dirname(BASELINE_FILE), exist_ok=True)
+        with open(BASELINE_FILE, "w") as f:
+            json.dump({"settings": settings, "scenarios": scenarios}, f, indent=2)
+            f.write("\n")
+        print(f"Baselines written to {os.path.relpath(BASELINE_FILE, ROOT)}")
+        return
+
+    for line in failed:
+        print(f"FAIL: {line}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Local stand-in for leetcode.com that answers from recorded fixtures.
+
+Serves `/graphql`, `/api/problems/all/`, `/problems/<slug>/submit/`,
+`/problems/<slug>/interpret_solution/` and
+`/submissions/detail/<id>/check/` from `benchmarks/fixtures`, with a fixed
+latency added to every response and a judge that stays PENDING for a
+configurable delay. Point the CLI at it with LEETCODE_BASE_URL:
+
+    python benchmarks/fake_server.py --port 8080 --latency 50 --judge-delay 1
+    LEETCODE_BASE_URL=http://127.0.0.1:8080 lc show two-sum
+
+GraphQL responses are looked up by operation name, first as
+`graphql/<operation>/<slug>.json` for the slug in the variables and then as
+`graphql/<operation>.json`. Operations without a fixture get a GraphQL
+error, like an unknown field would.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+_OPERATION_NAME = re.compile(r"^\s*(?:query|mutation)\s+(\w+)")
+_FIELDS = re.compile(r"question\(titleSlug: \$titleSlug\) \{ ([\w ]+) \}")
+_SUBMIT = re.compile(r"^/problems/([\w-]+)/(submit|interpret_solution)/$")
+_CHECK = re.compile(r"^/submissions/detail/([\w.-]+)/check/$")
+
+
+class FakeLeetCode:
+    """The fake server, run on a background thread
+
+    `stats` counts requests and response bytes per route, which benchmarks
+    can compare against what the client thinks it sent.
+    """
+
+    def __init__(
+        self,
+        fixtures: str = FIXTURES,
+        latency: float = 0.0,
+        judge_delay: float = 0.5,
+        problems: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.fixtures = fixtures
+        self.latency = latency
+        self.judge_delay = judge_delay
+        self.problems = problems
+        self.stats = Counter()
+        self.submissions = {}
+        self._ids = itertools.count(1400000100)
+        self._lock = threading.Lock()
+        self._cache = {}
+        self._server = _Server((host, port), _Handler)
+        self._server.app = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeLeetCode":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def fixture(self, *parts):
+        """Load a fixture by relative path, or None when it was not recorded"""
+        path = os.path.join(self.fixtures, *parts)
+        if path not in self._cache:
+            try:
+                with open(path, "rb") as f:
+                    self._cache[path] = f.read()
+            except OSError:
+                self._cache[path] = None
+        cached = self._cache[path]
+        return json.loads(cached) if cached is not None else None
+
+    def graphql(self, body: dict) -> dict:
+        query = body.get("query") or ""
+        variables = body.get("variables") or {}
+        match = _OPERATION_NAME.match(query)
+        operation = body.get("operationName") or (match.group(1) if match else "")
+        slug = variables.get("titleSlug") or variables.get("questionSlug")
+
+        if operation.startswith("questionFields"):
+            # Partial refreshes select a few scalar fields of questionData
+            fields = _FIELDS.search(query)
+            full = self.fixture("graphql", "questionData", f"{slug}.json")
+            if fields and full:
+                question = full["data"]["question"]
+                wanted = fields.group(1).split()
+                return {"data": {"question": {f: question.get(f) for f in wanted}}}
+
+        response = None
+        if slug:
+            response = self.fixture("graphql", operation, f"{slug}.json")
+        if response is None:
+            response = self.fixture("graphql", f"{operation}.json")
+        if response is None:
+            return {
+                "data": None,
+                "errors": [{"message": f"No fixture recorded for {operation}"}],
+            }
+        return response
+
+    def problems_all(self) -> dict:
+        """The recorded problem list, padded with synthetic problems"""
+        payload = self.fixture("problems_all.json")
+        pairs = payload["stat_status_pairs"]
+        known = {pair["stat"]["frontend_question_id"] for pair in pairs}
+        synthetic = (i for i in itertools.count(1) if i not in known)
+        for i in itertools.islice(synthetic, max(0, self.problems - len(pairs))):
+            pairs.append(
+                {
+                    "stat": {
+                        "question_id": i,
+                        "question__title": f"Problem {i}",
+                        "question__title_slug": f"problem-{i}",
+                        "question__hide": False,
+                        "total_acs": 1000 * i,
+                        "total_submitted": 2000 * i,
+                        "frontend_question_id": i,
+                        "is_new_question": False,
+                    },
+                    "status": None,
+                    "difficulty": {"level": i % 3 + 1},
+                    "paid_only": i % 7 == 0,
+                    "is_favor": False,
+                    "frequency": 0,
+                    "progress": 0,
+                }
+            )
+        payload["num_total"] = len(pairs)
+        return payload
+
+    def submit(self, kind: str) -> dict:
+        with self._lock:
+            submission_id = str(next(self._ids))
+            if kind == "interpret_solution":
+                submission_id = f"runcode_{submission_id}"
+            self.submissions[submission_id] = (kind, time.monotonic())
+        if kind == "interpret_solution":
+            return {"interpret_id": submission_id, "test_case": ""}
+        return {"submission_id": int(submission_id)}
+
+    def check(self, submission_id: str):
+        if submission_id not in self.submissions:
+            return None
+        kind, submitted_at = self.submissions[submission_id]
+        if time.monotonic() - submitted_at < self.judge_delay:
+            return {"state": "PENDING"}
+        name = "interpret.json" if kind == "interpret_solution" else "submit.json"
+        return dict(self.fixture("judge", name), submission_id=submission_id)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients dropping pooled keep-alive connections at exit is expected
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, route: str, status: int, payload):
+        app = self.server.app
+        if app.latency:
+            time.sleep(app.latency)
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with app._lock:
+            app.stats[f"{route}.requests"] += 1
+            app.stats[f"{route}.bytes"] += len(body)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return {}
+
+    def do_GET(self):
+        app = self.server.app
+        path = urlparse(self.path).path
+        if path == "/api/problems/all/":
+            return self._send("problems_all", 200, app.problems_all())
+
+        match = _CHECK.match(path)
+        if match:
+            result = app.check(match.group(1))
+            if result is None:
+                return self._send("check", 404, {"error": "Unknown submission"})
+            return self._send("check", 200, result)
+
+        self._send("unknown", 404, {"error": f"No route for GET {path}"})
+
+    def do_POST(self):
+        app = self.server.app
+        path = urlparse(self.path).path
+        body = self._body()
+        if path == "/graphql":
+            return self._send("graphql", 200, app.graphql(body))
+
+        match = _SUBMIT.match(path)
+        if match:
+            return self._send(match.group(2), 200, app.submit(match.group(2)))
+
+        self._send("unknown", 404, {"error": f"No route for POST {path}"})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Milliseconds added per response"
+    )
+    parser.add_argument(
+        "--judge-delay",
+        type=float,
+        default=0.5,
+        help="Seconds a submission stays PENDING",
+    )
+    parser.add_argument(
+        "--problems",
+        type=int,
+        default=0,
+        help="Pad /api/problems/all/ with synthetic problems up to this count",
+    )
+    parser.add_argument("--fixtures", default=FIXTURES)
+    args = parser.parse_args()
+
+    server = FakeLeetCode(
+        fixtures=args.fixtures,
+        latency=args.latency / 1000,
+        judge_delay=args.judge_delay,
+        problems=args.problems,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving fixtures from {args.fixtures} at {server.url}")
+    print(f"Use it with: LEETCODE_BASE_URL={server.url} lc ...")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Import time and per-call CPU of `src.server.graphql` vs the gql client.
+
+The gql side mirrors what `api.py` used to do on every call: build a client
+on a requests transport and parse the document with `gql()`. Both sides
+post to a stub session that answers instantly, so only client-side work is
+measured. gql is no longer a dependency; its half is skipped when it is not
+installed.
+
+    python benchmarks/graphql_client.py [--calls 2000] [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.server import graphql  # noqa: E402
+from src.server.solution_manager import QUESTION_DATA_QUERY  # noqa: E402
+
+VARIABLES = {"titleSlug": "two-sum"}
+PAYLOAD = json.dumps(
+    {"data": {"question": {"title": "Two Sum", "content": "x" * 4000}}}
+).encode("utf-8")
+
+
+class StubSession(requests.Session):
+    """Answers every request with PAYLOAD without touching the network"""
+
+    def request(self, method, url, *args, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = PAYLOAD
+        response.url = url
+        return response
+
+
+def import_ms(statement, runs):
+    """Fastest wall time of importing `statement` beyond a bare interpreter"""
+
+    def wall(code):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+        return time.perf_counter() - started
+
+    bare = min(wall("pass") for _ in range(runs))
+    return (min(wall(statement) for _ in range(runs)) - bare) * 1000
+
+
+def cpu_us_per_call(call, calls):
+    started = time.process_time()
+    for _ in range(calls):
+        call()
+    return (time.process_time() - started) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    session = StubSession()
+    document = graphql._documents[QUESTION_DATA_QUERY].decode("utf-8")
+    query = json.loads(document + "{}}")["query"]
+
+    rows = [
+        (
+            "src.server.graphql",
+            import_ms("import src.server.graphql", args.runs),
+            cpu_us_per_call(
+                lambda: graphql.execute(QUESTION_DATA_QUERY, VARIABLES, session),
+                args.calls,
+            ),
+        )
+    ]
+
+    try:
+        from gql import Client, gql
+        from gql.transport.requests import RequestsHTTPTransport
+    except ImportError:
+        print("gql is not installed; skipping the comparison")
+    else:
+
+        class StubTransport(RequestsHTTPTransport):
+            def connect(self):
+                self.session = session
+
+        def gql_call():
+            client = Client(
+                transport=StubTransport(url=graphql.BASE_URL),
+                fetch_schema_from_transport=False,
+            )
+            return client.execute(gql(query), variable_values=VARIABLES)
+
+        rows.append(
+            (
+                "gql",
+                import_ms(
+                    "from gql import Client, gql; "
+                    "from gql.transport.requests import RequestsHTTPTransport",
+                    args.runs,
+                ),
+                cpu_us_per_call(gql_call, args.calls),
+            )
+        )
+
+    print(f"{'client':<22}{'import':>12}{'CPU per call':>16}")
+    for name, imported_ms, call_us in rows:
+        print(f"{name:<22}{imported_ms:>10.1f}ms{call_us:>14.1f}us")
+
+
+if __name__ == "__main__":
+    main()
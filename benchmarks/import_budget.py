@@ -0,0 +1,110 @@
+"""Import-time budget for `lc --help`.
+
+Runs `python -X importtime -m src.main --help` a few times, takes the fastest
+run and fails when its imports exceed the budget, or when anything that only
+a dispatched command should need (the server layer, UI modules, requests,
+gql) gets imported. It also fails when the help that `src/main.py` registers
+for a command, to list it without importing it, no longer matches the first
+line of the command's docstring.
+
+    python benchmarks/import_budget.py [--budget-ms 300] [--runs 5]
+"""
+
+import argparse
+import importlib
+import inspect
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Most of this is typer and its rich help renderer, which `--help` always needs
+BUDGET_MS = 300
+FORBIDDEN_PREFIXES = ("src.commands", "src.server", "src.lib", "requests", "gql")
+
+
+def importtime(*argv):
+    """Return `[(module, cumulative us, is top-level)]` of one run"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Top-level imports are not indented; their cumulative time covers
+        # everything they pulled in
+        imports.append((name.strip(), int(cumulative), not name[1:].startswith(" ")))
+    return imports
+
+
+def measure(startup):
+    """Return (import ms, imported module names) of `lc --help` beyond startup"""
+    imports = importtime("-m", "src.main", "--help")
+    total_us = sum(
+        cumulative
+        for name, cumulative, top_level in imports
+        if top_level and name not in startup
+    )
+    return total_us / 1000, [name for name, _, _ in imports]
+
+
+def registry_mismatches():
+    """Return `[(command, registered help, docstring line)]` that disagree"""
+    sys.path.insert(0, ROOT)
+    import typer
+
+    from src.main import COMMANDS
+
+    mismatches = []
+    for name, (module_path, attribute, help) in COMMANDS.items():
+        function = getattr(importlib.import_module(module_path), attribute)
+        if isinstance(function, typer.Typer):
+            function = function.registered_callback.callback
+        docstring = (inspect.getdoc(function) or "").splitlines()
+        first_line = docstring[0] if docstring else ""
+        if help != first_line:
+            mismatches.append((name, help, first_line))
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # Whatever the bare interpreter imports (site, .pth hooks) is not ours
+    startup = {name for name, _, _ in importtime("-m", "runpy")}
+    runs = [measure(startup) for _ in range(args.runs)]
+    total_ms, modules = min(runs, key=lambda run: run[0])
+    forbidden = sorted(
+        name
+        for name in modules
+        if any(name == p or name.startswith(p + ".") for p in FORBIDDEN_PREFIXES)
+    )
+
+    print(f"lc --help imports: {total_ms:.1f}ms (budget {args.budget_ms:.0f}ms)")
+    failed = False
+    if total_ms > args.budget_ms:
+        print("FAIL: over budget")
+        failed = True
+    if forbidden:
+        print("FAIL: imported eagerly: " + ", ".join(forbidden))
+        failed = True
+    for name, help, first_line in registry_mismatches():
+        print(
+            f"FAIL: {name} is registered as {help!r} but documented as {first_line!r}"
+        )
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
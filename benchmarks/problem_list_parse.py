@@ -0,0 +1,155 @@
+"""Peak RSS of parsing `/api/problems/all/`: full `json.loads` vs streaming.
+
+Each measurement runs in a fresh interpreter so the peak reflects only
+that strategy. The payload is a synthetic list shaped like the real one and
+is read from disk in network-sized chunks.
+
+    python benchmarks/problem_list_parse.py [--problems 3500]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.server.catalog import (  # noqa: E402
+    STREAM_CHUNK_SIZE,
+    build_index,
+    iter_stat_status_pairs,
+)
+
+STRATEGIES = ["baseline", "json-lookup", "stream-lookup", "json-index", "stream-index"]
+
+
+def make_payload(path, problems):
+    pairs = []
+    for i in range(1, problems + 1):
+        pairs.append(
+            {
+                "stat": {
+                    "question_id": i,
+                    "question__article__live": i % 2 == 0,
+                    "question__article__slug": f"problem-{i}",
+                    "question__article__has_video_solution": False,
+                    "question__title": f"Problem Number {i}",
+                    "question__title_slug": f"problem-{i}",
+                    "question__hide": False,
+                    "total_acs": 1000 * i,
+                    "total_submitted": 2000 * i,
+                    "frontend_question_id": i,
+                    "is_new_question": False,
+                },
+                "status": None,
+                "difficulty": {"level": i % 3 + 1},
+                "paid_only": i % 7 == 0,
+                "is_favor": False,
+                "frequency": 0,
+                "progress": 0,
+            }
+        )
+    payload = {
+        "user_name": "",
+        "num_solved": 0,
+        "num_total": problems,
+        "ac_easy": 0,
+        "ac_medium": 0,
+        "ac_hard": 0,
+        "stat_status_pairs": pairs,
+        "frequency_high": 0,
+        "frequency_mid": 0,
+        "category_slug": "all",
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f)
+
+
+def read_chunks(path):
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def run_strategy(strategy, path, target):
+    if strategy.startswith("json"):
+        # What `response.json()` does: buffer the body, then decode it all
+        pairs = json.loads(b"".join(read_chunks(path)))["stat_status_pairs"]
+    else:
+        pairs = iter_stat_status_pairs(read_chunks(path))
+
+    if strategy.endswith("lookup"):
+        for pair in pairs:
+            if str(pair["stat"]["frontend_question_id"]) == target:
+                break
+    elif strategy.endswith("index"):
+        build_index(pairs)
+
+
+def peak_rss_kb():
+    """Peak RSS of this process in KB
+
+    Linux keeps `ru_maxrss` across fork/exec, so the parent's footprint
+    would leak into every child; `VmHWM` is reset by exec and is preferred.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(strategy, path, target):
+    output = subprocess.check_output(
+        [sys.executable, __file__, "--child", strategy, "--payload", path, target]
+    )
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--problems", type=int, default=3500)
+    parser.add_argument("--child", choices=STRATEGIES)
+    parser.add_argument("--payload")
+    parser.add_argument("target", nargs="?")
+    args = parser.parse_args()
+
+    if args.child:
+        started = time.perf_counter()
+        run_strategy(args.child, args.payload, args.target)
+        elapsed = time.perf_counter() - started
+        peak_kb = peak_rss_kb()
+        print(json.dumps({"peak_kb": peak_kb, "seconds": elapsed}))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "problems.json")
+        make_payload(path, args.problems)
+        size_mb = os.path.getsize(path) / 1e6
+        target = str(args.problems // 10)
+
+        print(f"payload: {args.problems} problems, {size_mb:.1f} MB, lookup #{target}")
+        print(f"{'strategy':<16}{'peak RSS':>12}{'over baseline':>16}{'time':>10}")
+        baseline = None
+        for strategy in STRATEGIES:
+            result = measure(strategy, path, target)
+            baseline = baseline if baseline is not None else result["peak_kb"]
+            print(
+                f"{strategy:<16}{result['peak_kb'] / 1024:>10.1f}MB"
+                f"{(result['peak_kb'] - baseline) / 1024:>14.1f}MB"
+                f"{result['seconds'] * 1000:>8.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
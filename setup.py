@@ -14,7 +14,6 @@ setup(
         "setuptools",
         "typer",
         "requests",
-        "gql[all]",
         "bs4",
         "markdownify",
         "rich",
@@ -1,4 +0,0 @@
-from .profile import profile
-from .show import show
-
-__all__ = ["show", "profile"]
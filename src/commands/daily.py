@@ -31,7 +31,12 @@ def daily(
         question = result["data"]["activeDailyCodingChallengeQuestion"]
         typer.echo("\r" + " " * 30 + "\r", nl=False)
 
-        show(problem=question["question"]["titleSlug"], save=False, compact=not full)
+        show(
+            problem=question["question"]["titleSlug"],
+            save=False,
+            compact=not full,
+            refresh=False,
+        )
     except Exception as e:
         typer.echo(
             "\n"
@@ -43,7 +48,13 @@ def daily(
 
     if not no_editor and editor:
         try:
-            edit(problem=question["question"]["titleSlug"], lang=lang, editor=editor)
+            edit(
+                problem=question["question"]["titleSlug"],
+                lang=lang,
+                editor=editor,
+                refresh=False,
+                no_open=False,
+            )
         except Exception as e:
             typer.echo(
                 typer.style(f"❌ Failed to open editor: {str(e)}", fg=typer.colors.RED)
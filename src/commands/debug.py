@@ -0,0 +1,29 @@
+import typer
+
+debug_app = typer.Typer(add_completion=False)
+
+
+@debug_app.callback()
+def debug():
+    """Inspect the CLI's own behaviour"""
+
+
+@debug_app.command()
+def stats(
+    reset: bool = typer.Option(False, "--reset", help="Clear the recorded metrics"),
+):
+    """Show request counts, bytes downloaded, cache hit ratios and latencies
+
+    Metrics accumulate across invocations in the app config directory.
+    Set LEETCODE_METRICS=0 to stop recording them.
+    """
+    from ..server import metrics
+
+    if reset:
+        metrics.reset()
+        typer.echo(typer.style("✓ Metrics cleared", fg=typer.colors.GREEN))
+        return
+
+    from ..lib.stats_ui import display_stats
+
+    display_stats(metrics.load())
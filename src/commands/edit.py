@@ -10,6 +10,12 @@ def edit(
     editor: str = typer.Option(
         "vim", "-e", "--editor", help="Editor to use for code editing."
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ignore the local cache and fetch fresh data"
+    ),
+    no_open: bool = typer.Option(
+        False, "--no-open", help="Only create the files, without opening an editor"
+    ),
 ):
     """Solves a problem by passing lang param and open it with your code editor."""
     from ..server.auth import Auth
@@ -19,12 +25,11 @@ def edit(
 
     solution_manager = SolutionManager(Auth().get_session())
 
-    question_data = (
-        solution_manager.get_question_data(problem).get("data", {}).get("question")
-    )
+    data = solution_manager.get_question_data(problem, refresh=refresh)
+    question_data = data.get("data", {}).get("question")
 
     if not question_data:
-        typer.echo(f"Problem {problem} not found.")
+        typer.echo(data.get("error") or f"Problem {problem} not found.")
         return
 
     filename_prefix = question_data.get("questionFrontendId") or (
@@ -74,6 +79,10 @@ def edit(
     if not os.path.exists(code_file_path):
         code_file_path = create_file_with_template(lang)
 
+    if no_open:
+        typer.echo(f"Created {code_file_path}")
+        return
+
     if not os.path.exists(markdown_file):
         typer.echo(f"Warning: Problem description file not found: {markdown_file}")
         subprocess.run([editor, code_file_path])
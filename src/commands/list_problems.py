@@ -72,4 +72,7 @@ def list_problems(
                 "tags": tags,
             },
         )
+
+    if not data:
+        raise typer.Exit(1)
     display_problem_list(data)
@@ -1,13 +1,21 @@
+import typer
+
+
 def profile():
-    """List all available LeetCode problems."""
+    """Show your LeetCode profile."""
     from rich.live import Live
     from rich.spinner import Spinner
 
     from ..lib.profile_ui import display_user_stats
     from ..server.api import fetch_user_profile
+    from ..server.cache import CacheMissError
 
     spinner = Spinner("dots")
-    with Live(spinner, refresh_per_second=10, transient=True) as live:
-        live.console.print("[cyan]Fetching user profile...")
-        data = fetch_user_profile()
+    try:
+        with Live(spinner, refresh_per_second=10, transient=True) as live:
+            live.console.print("[cyan]Fetching user profile...")
+            data = fetch_user_profile()
+    except CacheMissError as e:
+        typer.echo(typer.style(f"❌ {str(e)}", fg=typer.colors.RED))
+        raise typer.Exit(1)
     display_user_stats(data)
@@ -13,12 +13,16 @@ def show(
     compact: bool = typer.Option(
         False, "--compact", "-c", help="Display in compact layout"
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ignore the local cache and fetch fresh data"
+    ),
 ):
     """
     Show problem details including description and test cases
 
     Fetches and displays the problem statement, examples, and metadata.
     Use --compact for a condensed view or --save to export to a file.
+    Problems are served from the local cache; use --refresh to bypass it.
     """
 
     from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -45,12 +49,11 @@ def show(
             transient=True,
         ) as progress:
             progress.add_task("Fetching problem data...", total=1)
-            data = solution_manager.get_question_data(problem)
+            data = solution_manager.get_question_data(problem, refresh=refresh)
 
         if not data.get("data", {}).get("question"):
-            typer.echo(
-                typer.style(f"❌ Problem '{problem}' not found", fg=typer.colors.RED)
-            )
+            message = data.get("error") or f"Problem '{problem}' not found"
+            typer.echo(typer.style(f"❌ {message}", fg=typer.colors.RED))
             raise typer.Exit(data.get("errors", ["Unknown error"]))
 
         question = data.get("data", {}).get("question")
@@ -1,6 +1,7 @@
 import os
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import typer
 
@@ -14,6 +15,9 @@ def submit(
         None, help="Programming language (auto-detected if not specified)"
     ),
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Submit even if this code was judged before"
+    ),
 ):
     """
     Submit a solution to LeetCode
@@ -82,9 +86,160 @@ def submit(
 
         with create_submission_progress() as progress:
             progress.add_task("Submitting...", total=1)
-            result = solution_manager.submit_solution(problem, code, lang)
+            result = solution_manager.submit_solution(
+                problem, code, lang, use_cache=not no_cache
+            )
 
         display_submission_results(result, is_test=False)
 
     except Exception as e:
         display_exception_error(e)
+
+
+def _problem_for(file: Path) -> str:
+    """The problem number a solution file starts with, or else its slug"""
+    match = re.match(r"\d+", file.name)
+    return match.group(0) if match else file.name.split(".")[0]
+
+
+def _collect_solutions(paths: List[Path], lang: Optional[str]) -> List[Dict[str, Any]]:
+    """Find the solution files of a batch and the problem of each"""
+    from ..lib.submission_ui import (
+        display_file_not_found_error,
+        display_language_detection_error,
+    )
+    from ..server.config import LANGUAGE_MAP
+
+    languages = set(LANGUAGE_MAP.values())
+    jobs = []
+    for path in paths:
+        if not path.exists():
+            display_file_not_found_error(path)
+
+        # Directories also hold the problem descriptions `lc edit` saves
+        explicit = not path.is_dir()
+        files = [path] if explicit else sorted(p for p in path.iterdir() if p.is_file())
+        for file in files:
+            extension = file.suffix[1:].lower()
+            detected = LANGUAGE_MAP.get(extension) or (
+                extension if extension in languages else None
+            )
+            if not detected and not explicit:
+                continue
+            if not (lang or detected):
+                display_language_detection_error(extension)
+
+            jobs.append(
+                {
+                    "file": file,
+                    "problem": _problem_for(file),
+                    "lang": lang or detected,
+                    "state": "queued",
+                    "result": None,
+                }
+            )
+
+    jobs.sort(
+        key=lambda job: (
+            not job["problem"].isdigit(),
+            int(job["problem"]) if job["problem"].isdigit() else 0,
+            str(job["file"]),
+        )
+    )
+    return jobs
+
+
+def submit_batch(
+    paths: List[Path] = typer.Argument(
+        ..., help="Solution files, or directories of them, named like `lc edit` files"
+    ),
+    lang: Optional[str] = typer.Option(
+        None, help="Programming language (auto-detected if not specified)"
+    ),
+    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation prompt"),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w", help="Concurrent submissions"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Submit even if this code was judged before"
+    ),
+):
+    """
+    Submit many solutions to LeetCode at once
+
+    Every solution file given or found in the given directories is
+    submitted, matched to its problem by the number (or slug) its name
+    starts with, as in `1.py` or `two-sum.cpp`. Verdicts show up as they
+    arrive.
+    """
+    import asyncio
+
+    from ..lib.submission_ui import (
+        create_batch_live,
+        create_batch_table,
+        display_auth_error,
+        display_batch_details,
+        display_batch_summary,
+        display_submission_canceled,
+    )
+    from ..server.async_api import AsyncLeetCodeClient, gather_limited
+    from ..server.auth import Auth
+    from ..server.config import SUBMISSION_RESULT_TIMEOUT, SUBMIT_BATCH_WORKERS
+    from ..server.solution_manager import SolutionManager
+
+    workers = workers or SUBMIT_BATCH_WORKERS
+    auth_manager = Auth()
+    if not auth_manager.is_authenticated:
+        display_auth_error()
+
+    jobs = _collect_solutions(paths, lang)
+    if not jobs:
+        typer.echo(typer.style("No solution files found", fg=typer.colors.YELLOW))
+        raise typer.Exit(1)
+
+    if not force and not display_batch_details(jobs):
+        display_submission_canceled()
+        return
+
+    client = AsyncLeetCodeClient(SolutionManager(auth_manager.get_session()))
+
+    with create_batch_live(jobs) as live:
+
+        def update(job: Dict[str, Any], state: str, result=None):
+            job["state"], job["result"] = state, result
+            live.update(create_batch_table(jobs))
+
+        async def run(job: Dict[str, Any]):
+            try:
+                with open(job["file"], "r") as f:
+                    code = f.read()
+            except OSError as e:
+                return update(job, "done", {"success": False, "error": str(e)})
+
+            if not no_cache:
+                cached = await client.cached_result(
+                    "submit", job["problem"], code, job["lang"]
+                )
+                if cached:
+                    return update(job, "done", cached)
+
+            update(job, "submitting")
+            started = await client.start_submission(job["problem"], code, job["lang"])
+            if not started["success"]:
+                return update(job, "done", started)
+
+            update(job, "judging")
+            result = await client.poll_result(
+                started["submission_id"], SUBMISSION_RESULT_TIMEOUT
+            )
+            client.solution_manager.remember_result(
+                "submit", started, code, job["lang"], result
+            )
+            update(job, "done", result)
+
+        asyncio.run(gather_limited((run(job) for job in jobs), max(1, workers)))
+
+    accepted = sum(1 for job in jobs if (job["result"] or {}).get("status_code") == 10)
+    display_batch_summary(accepted, len(jobs))
+    if accepted < len(jobs):
+        raise typer.Exit(1)
@@ -0,0 +1,206 @@
+import json
+from pathlib import Path
+from typing import List, Optional, Set
+
+import typer
+
+
+def sync(
+    difficulty: Optional[str] = typer.Option(
+        None, "--difficulty", "-d", help="Only sync easy/medium/hard problems"
+    ),
+    tag: Optional[str] = typer.Option(
+        None, "--tag", "-t", help="Only sync problems with these tags (comma-separated)"
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-w", help="Number of concurrent fetches"
+    ),
+    include_paid: bool = typer.Option(
+        False, "--include-paid", help="Also sync premium-only problems"
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Re-fetch problems that are already cached"
+    ),
+    restart: bool = typer.Option(
+        False, "--restart", help="Ignore the checkpoint of an interrupted sync"
+    ),
+):
+    """
+    Download problems into the local cache for offline use
+
+    Walks the problem catalog and fetches every problem (or a subset
+    filtered by difficulty or tag) with a bounded pool of workers.
+    An interrupted sync resumes from its last checkpoint.
+    """
+    import asyncio
+
+    from rich.progress import (
+        BarColumn,
+        MofNCompleteColumn,
+        Progress,
+        SpinnerColumn,
+        TextColumn,
+        TimeRemainingColumn,
+    )
+
+    from ..server.async_api import AsyncLeetCodeClient, gather_limited
+    from ..server.auth import Auth
+    from ..server.config import CACHE_EVICT_RATIO, SYNC_CHECKPOINT_EVERY, SYNC_WORKERS
+    from ..server.solution_manager import SolutionManager
+
+    workers = workers or SYNC_WORKERS
+    auth_manager = Auth()
+    solution_manager = SolutionManager(auth_manager.get_session(), memoize=False)
+
+    try:
+        index = solution_manager.catalog.ensure(auth_manager.get_session())
+    except Exception as e:
+        typer.echo(
+            typer.style(f"❌ Failed to load problem catalog: {e}", fg=typer.colors.RED)
+        )
+        raise typer.Exit(1)
+
+    slugs = [
+        slug
+        for slug, problem in index["by_slug"].items()
+        if (include_paid or not problem["paid_only"])
+        and (not difficulty or problem["difficulty"].lower() == difficulty.lower())
+    ]
+
+    if tag:
+        tagged = _slugs_for_tags(auth_manager, [t.strip() for t in tag.split(",")])
+        slugs = [slug for slug in slugs if slug in tagged]
+
+    checkpoint_key = {
+        "difficulty": difficulty,
+        "tag": tag,
+        "include_paid": include_paid,
+        "refresh": refresh,
+    }
+    checkpoint_file = solution_manager.catalog.config_dir / "sync_checkpoint.json"
+    done = set() if restart else _load_checkpoint(checkpoint_file, checkpoint_key)
+    pending = [slug for slug in slugs if slug not in done]
+
+    if not pending:
+        typer.echo(typer.style("✓ Everything is already synced", fg=typer.colors.GREEN))
+        _clear_checkpoint(checkpoint_file)
+        return
+
+    client = AsyncLeetCodeClient(solution_manager)
+    store = solution_manager.question_cache.store
+    failed: List[str] = []
+    skipped: List[str] = []
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeRemainingColumn(),
+    ) as progress:
+        task = progress.add_task("Syncing problems...", total=len(slugs))
+        progress.update(task, completed=len(slugs) - len(pending))
+
+        async def fetch(slug: str):
+            # Stop short of the budget rather than let eviction drop problems
+            # this sync already fetched; the margin absorbs in-flight workers
+            if store.size() > store.max_bytes * CACHE_EVICT_RATIO:
+                skipped.append(slug)
+                return
+            result = await client.get_question_data(slug, refresh=refresh)
+            if (result.get("data") or {}).get("question"):
+                done.add(slug)
+                if len(done) % SYNC_CHECKPOINT_EVERY == 0:
+                    _save_checkpoint(checkpoint_file, checkpoint_key, done)
+            else:
+                failed.append(slug)
+            progress.advance(task)
+
+        try:
+            asyncio.run(gather_limited((fetch(slug) for slug in pending), workers))
+        except KeyboardInterrupt:
+            _save_checkpoint(checkpoint_file, checkpoint_key, done)
+            typer.echo(
+                typer.style(
+                    "\nSync interrupted; run it again to resume.",
+                    fg=typer.colors.YELLOW,
+                )
+            )
+            raise typer.Exit(130)
+
+    if skipped:
+        _save_checkpoint(checkpoint_file, checkpoint_key, done)
+        typer.echo(
+            typer.style(
+                f"⚠️  The question cache is full ({store.size() // 2**20} MB of "
+                f"{store.max_bytes // 2**20} MB); synced {len(done)} of "
+                f"{len(slugs)} problems. Raise LEETCODE_QUESTION_CACHE_MB to "
+                "sync the rest.",
+                fg=typer.colors.YELLOW,
+            )
+        )
+        raise typer.Exit(1)
+
+    if failed:
+        _save_checkpoint(checkpoint_file, checkpoint_key, done)
+        typer.echo(
+            typer.style(
+                f"⚠️  {len(failed)} problem(s) failed to sync; run it again to retry.",
+                fg=typer.colors.YELLOW,
+            )
+        )
+        raise typer.Exit(1)
+
+    _clear_checkpoint(checkpoint_file)
+    typer.echo(typer.style(f"✓ Synced {len(slugs)} problems", fg=typer.colors.GREEN))
+
+
+def _slugs_for_tags(auth_manager, tags: List[str]) -> Set[str]:
+    """Collect the slugs of every problem carrying the given tags"""
+    from ..server.api import fetch_problem_list
+
+    session = auth_manager.session_manager.load_session() or {}
+    slugs: Set[str] = set()
+    skip, limit = 0, 100
+
+    while True:
+        data = fetch_problem_list(
+            csrf_token=session.get("csrftoken"),
+            session_id=session.get("session_token"),
+            categorySlug="all-code-essentials",
+            limit=limit,
+            skip=skip,
+            filters={"tags": tags},
+        )
+        if not data:
+            break
+
+        listing = data["problemsetQuestionList"]
+        slugs.update(question["titleSlug"] for question in listing["questions"])
+        skip += limit
+        if skip >= listing["total"]:
+            break
+
+    return slugs
+
+
+def _load_checkpoint(checkpoint_file: Path, key: dict) -> Set[str]:
+    """Return the slugs finished by an interrupted sync with the same filters"""
+    try:
+        with open(checkpoint_file, "r") as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("key") == key:
+            return set(checkpoint.get("done", []))
+    except Exception:
+        pass
+    return set()
+
+
+def _save_checkpoint(checkpoint_file: Path, key: dict, done: Set[str]):
+    with open(checkpoint_file, "w") as f:
+        json.dump({"key": key, "done": sorted(done)}, f)
+
+
+def _clear_checkpoint(checkpoint_file: Path):
+    if checkpoint_file.exists():
+        checkpoint_file.unlink()
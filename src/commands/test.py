@@ -2,12 +2,34 @@ from pathlib import Path
 
 import typer
 
-from src.server.config import LANGUAGE_MAP
-
 
 def test(
     problem: str = typer.Argument(..., help="Problem slug (e.g., 'two-sum')"),
     file: Path = typer.Argument(..., help="Path to solution file"),
+    local: bool = typer.Option(
+        False, "--local", help="Run the examples locally first; stop if one fails"
+    ),
+    mem: bool = typer.Option(
+        False,
+        "--mem",
+        help="Also profile memory locally on a large input (implies --local)",
+    ),
+    complexity: bool = typer.Option(
+        False,
+        "--complexity",
+        help="Estimate the time complexity locally on random inputs instead",
+    ),
+    strict: bool = typer.Option(
+        False,
+        "--strict",
+        help="With --local, also stop when an output differs from the example",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Run the judge even if this code was judged before"
+    ),
+    watch: bool = typer.Option(
+        False, "--watch", "-w", help="Test again whenever the file is saved"
+    ),
 ):
     """Test a solution with LeetCode's test cases"""
 
@@ -21,6 +43,7 @@ def test(
         display_submission_results,
     )
     from ..server.auth import Auth
+    from ..server.config import LANGUAGE_MAP
     from ..server.solution_manager import SolutionManager
 
     auth_manager = Auth()
@@ -45,12 +68,203 @@ def test(
 
     display_language_detection_message(lang)
 
+    if watch and complexity:
+        raise typer.BadParameter("--watch cannot be combined with --complexity")
+    if watch:
+        return _watch(
+            solution_manager,
+            problem,
+            file,
+            lang,
+            local=local or mem,
+            mem=mem,
+            strict=strict,
+            no_cache=no_cache,
+        )
+
+    if complexity:
+        return _profile_complexity(solution_manager, problem, code, lang)
+
+    if (local or mem) and _run_locally(solution_manager, problem, code, lang, strict):
+        if mem:
+            _profile_memory(solution_manager, problem, code, lang)
+
     try:
         with create_submission_progress() as progress:
             progress.add_task("Testing...", total=1)
-            result = solution_manager.test_solution(problem, code, lang)
+            result = solution_manager.test_solution(
+                problem, code, lang, use_cache=not no_cache
+            )
 
         display_submission_results(result, is_test=True)
 
     except Exception as e:
         display_exception_error(e)
+
+
+def _run_locally(
+    solution_manager, problem: str, code: str, lang: str, strict: bool = False
+) -> bool:
+    """Check a solution against the examples locally, exiting if one fails
+
+    A case fails on an error or a timeout; with `strict`, also when its
+    output differs from the example's. Returns False when the solution
+    cannot be run locally.
+    """
+    from ..lib.submission_ui import (
+        create_submission_progress,
+        display_local_results,
+        display_local_unsupported,
+        display_problem_not_found_error,
+    )
+    from ..server.local_runner import FAILED_STATUSES, UnsupportedError, run_examples
+
+    question = (
+        solution_manager.get_question_data(problem).get("data", {}).get("question")
+    )
+    if not question:
+        display_problem_not_found_error(problem)
+
+    try:
+        with create_submission_progress() as progress:
+            progress.add_task("Running locally...", total=1)
+            cases = run_examples(question, code, lang)
+    except UnsupportedError as e:
+        display_local_unsupported(str(e))
+        return False
+
+    display_local_results(cases)
+    failed = FAILED_STATUSES | {"failed"} if strict else FAILED_STATUSES
+    if any(case["status"] in failed for case in cases):
+        raise typer.Exit(1)
+    return True
+
+
+def _profile_complexity(solution_manager, problem: str, code: str, lang: str):
+    """Time a solution locally on growing random inputs and report its growth"""
+    from ..lib.submission_ui import (
+        create_submission_progress,
+        display_complexity_report,
+        display_local_unsupported,
+        display_problem_not_found_error,
+    )
+    from ..server.complexity import profile
+    from ..server.local_runner import UnsupportedError
+
+    question = (
+        solution_manager.get_question_data(problem).get("data", {}).get("question")
+    )
+    if not question:
+        display_problem_not_found_error(problem)
+
+    try:
+        with create_submission_progress() as progress:
+            progress.add_task("Profiling on random inputs...", total=1)
+            report = profile(question, code, lang)
+    except UnsupportedError as e:
+        display_local_unsupported(str(e))
+        raise typer.Exit(1)
+
+    display_complexity_report(report)
+
+
+def _profile_memory(solution_manager, problem: str, code: str, lang: str):
+    """Report peak memory on a large input, exiting if it would exceed the limit"""
+    from ..lib.submission_ui import (
+        create_submission_progress,
+        display_local_unsupported,
+        display_memory_report,
+    )
+    from ..server.local_runner import UnsupportedError
+    from ..server.memory_profile import profile_memory
+
+    question = (
+        solution_manager.get_question_data(problem).get("data", {}).get("question")
+    )
+    try:
+        with create_submission_progress() as progress:
+            progress.add_task("Profiling memory...", total=1)
+            report = profile_memory(question, code, lang)
+    except UnsupportedError as e:
+        display_local_unsupported(str(e))
+        return
+
+    display_memory_report(report)
+    if report["peak"] and report["peak"] > report["limit_threshold"]:
+        raise typer.Exit(1)
+
+
+def _watch(
+    solution_manager,
+    problem: str,
+    file: Path,
+    lang: str,
+    *,
+    local: bool,
+    mem: bool,
+    strict: bool,
+    no_cache: bool,
+):
+    """Test again on every save of the file, until interrupted
+
+    One session serves every run. A save while the judge is still busy
+    abandons the stale run and starts over with the new code.
+    """
+    from ..lib.submission_ui import (
+        create_submission_progress,
+        display_exception_error,
+        display_submission_results,
+        display_watch_canceled,
+        display_watch_header,
+        display_watch_stopped,
+        display_watch_waiting,
+    )
+    from ..server.file_watcher import FileWatcher
+
+    watcher = FileWatcher(str(file))
+    watcher.start()
+    try:
+        while True:
+            watcher.changed.clear()
+            with open(file, "r") as f:
+                code = f.read()
+            display_watch_header(file)
+
+            try:
+                if local and _run_locally(
+                    solution_manager, problem, code, lang, strict
+                ):
+                    if mem:
+                        _profile_memory(solution_manager, problem, code, lang)
+
+                result = None
+                if not watcher.changed.is_set():
+                    with create_submission_progress() as progress:
+                        progress.add_task("Testing...", total=1)
+                        result = solution_manager.test_solution(
+                            problem,
+                            code,
+                            lang,
+                            use_cache=not no_cache,
+                            cancel=watcher.changed,
+                        )
+                if result is None or result.get("canceled"):
+                    display_watch_canceled()
+                else:
+                    display_submission_results(result, is_test=True)
+            except typer.Exit:
+                # A failed local run or an error; wait for the next save
+                pass
+            except Exception as e:
+                try:
+                    display_exception_error(e)
+                except typer.Exit:
+                    pass
+
+            if not watcher.changed.is_set():
+                display_watch_waiting(file)
+            watcher.changed.wait()
+    except KeyboardInterrupt:
+        display_watch_stopped()
+    finally:
+        watcher.stop()
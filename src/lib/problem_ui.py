@@ -8,6 +8,9 @@ from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.text import Text
 
+from ..server.config import LEETCODE_BASE_URL
+from ..server.timings import timed
+
 console = Console()
 
 COLORS = {
@@ -43,6 +46,7 @@ class ProblemDetails:
             except json.JSONDecodeError:
                 self.stats = {}
 
+    @timed("ui.problem.markdown")
     def _format_markdown(self, content):
         md = markdownify.markdownify(content, heading_style="ATX", bullet_style="-")
         md = re.sub(r"^(Example \d+:)", r"### \1", md, flags=re.MULTILINE)
@@ -100,7 +104,7 @@ class ProblemDetails:
                 if "titleSlug" in q:
                     slug = q.get("titleSlug")
                     title_display = (
-                        f"[link=https://leetcode.com/problems/{slug}/]{title}[/link]"
+                        f"[link={LEETCODE_BASE_URL}/problems/{slug}/]{title}[/link]"
                     )
                 else:
                     title_display = title
@@ -113,6 +117,7 @@ class ProblemDetails:
 
         return "\n".join(lines)
 
+    @timed("ui.problem.description")
     def display_probelm(self):
         formatted_md = self._format_markdown(self.content)
 
@@ -126,6 +131,7 @@ class ProblemDetails:
         )
         console.print(content_panel)
 
+    @timed("ui.problem.stats")
     def display_stats(self):
         stats_panel = Panel(
             self._format_stats(),
@@ -136,6 +142,7 @@ class ProblemDetails:
         )
         console.print(stats_panel)
 
+    @timed("ui.problem.additional_info")
     def display_additional_info(self):
         info_content = []
 
@@ -5,6 +5,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from ..server.timings import span, timed
+
 console = Console()
 
 
@@ -13,6 +15,7 @@ def format_timestamp(timestamp):
     return dt.strftime("%Y-%m-%d %H:%M")
 
 
+@timed("ui.profile.recent_activity")
 def create_recent_activity(recent_submissions):
     if not recent_submissions or "recentAcSubmissionList" not in recent_submissions:
         return None
@@ -36,6 +39,7 @@ def create_recent_activity(recent_submissions):
     return table
 
 
+@timed("ui.profile.progress")
 def create_progress_panel(data):
     if not data.get("progress"):
         return None
@@ -82,6 +86,7 @@ def create_social_links(user, websites=None):
     return "\n".join(links) if links else "No social links"
 
 
+@timed("ui.profile.language_stats")
 def create_language_stats(data):
     if not data or "matchedUser" not in data:
         return None
@@ -105,6 +110,7 @@ def create_language_stats(data):
     )
 
 
+@timed("ui.profile.contest_stats")
 def create_contest_stats(contest_info):
     stats = []
     ranking = contest_info.get("userContestRanking", {}) if contest_info else {}
@@ -118,6 +124,7 @@ def create_contest_stats(contest_info):
     return "\n".join(stats)
 
 
+@timed("ui.profile.skill_stats")
 def create_skill_stats(data):
     if not data.get("skillStats"):
         return None
@@ -143,6 +150,7 @@ def create_skill_stats(data):
     return table
 
 
+@timed("ui.profile")
 def display_user_stats(data):
     console.clear()
     profile_width, stats_width, progress_width = 65, 35, 30
@@ -244,13 +252,15 @@ def display_user_stats(data):
         else "",
     )
 
-    console.print("\n")
-    console.print(top_grid)
-    console.print("\n")
-    console.print(bottom_grid)
-    console.print("\n")
+    with span("ui.profile.print"):
+        console.print("\n")
+        console.print(top_grid)
+        console.print("\n")
+        console.print(bottom_grid)
+        console.print("\n")
 
 
+@timed("ui.problem_list")
 def display_problem_list(data):
     console.clear()
     console.print("\n")
@@ -6,11 +6,13 @@ from rich.console import Console
 from rich.markup import escape
 from rich.table import Table
 
+from ..server.config import LEETCODE_BASE_URL
+
 console = Console()
 
 
 class SolutionUI:
-    LEETCODE_BASE_URL = "https://leetcode.com/problems/"
+    LEETCODE_BASE_URL = f"{LEETCODE_BASE_URL}/problems/"
     COLUMNS = ["#", "Title", "Author", "Date", "Stats", "Tags"]
     COLUMN_WIDTHS = {
         "#": 3,
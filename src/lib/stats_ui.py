@@ -0,0 +1,99 @@
+from datetime import datetime
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from ..server.metrics import median
+
+console = Console()
+
+
+def _size(num_bytes: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if num_bytes < 1024:
+            return (
+                f"{num_bytes:.0f} {unit}" if unit == "B" else f"{num_bytes:.1f} {unit}"
+            )
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+
+def display_stats(data):
+    """Print the request, cache and latency metrics gathered so far"""
+    since = datetime.fromtimestamp(data["since"]).strftime("%Y-%m-%d %H:%M")
+    console.print(
+        f"[bold]Recorded since {since}[/bold] "
+        f"[dim]({data['invocations']} runs with network or cache activity)[/dim]"
+    )
+
+    endpoints = data["endpoints"]
+    if endpoints:
+        table = Table(title="HTTP", box=box.ROUNDED, title_style="bold")
+        table.add_column("Endpoint", style="cyan")
+        table.add_column("Requests", justify="right")
+        table.add_column("Errors", justify="right")
+        table.add_column("Downloaded", justify="right")
+        table.add_column("Median", justify="right")
+
+        for name, counts in sorted(endpoints.items(), key=lambda e: -e[1]["bytes"]):
+            latency = median(data["latency"].get(name, []))
+            table.add_row(
+                name,
+                str(counts["requests"]),
+                str(counts["errors"]) if counts["errors"] else "-",
+                _size(counts["bytes"]),
+                f"{latency:.0f} ms" if latency is not None else "-",
+            )
+        table.add_section()
+        table.add_row(
+            "total",
+            str(sum(c["requests"] for c in endpoints.values())),
+            str(sum(c["errors"] for c in endpoints.values())),
+            _size(sum(c["bytes"] for c in endpoints.values())),
+            "",
+            style="bold",
+        )
+        console.print(table)
+
+    operations = {
+        name[len("graphql ") :]: samples
+        for name, samples in data["latency"].items()
+        if name.startswith("graphql ")
+    }
+    if operations:
+        table = Table(title="GraphQL operations", box=box.ROUNDED, title_style="bold")
+        table.add_column("Operation", style="cyan")
+        table.add_column("Samples", justify="right")
+        table.add_column("Median", justify="right")
+        table.add_column("Max", justify="right")
+
+        for name, samples in sorted(operations.items()):
+            table.add_row(
+                name,
+                str(len(samples)),
+                f"{median(samples):.0f} ms",
+                f"{max(samples):.0f} ms",
+            )
+        console.print(table)
+
+    caches = data["caches"]
+    if caches:
+        table = Table(title="Caches", box=box.ROUNDED, title_style="bold")
+        table.add_column("Cache", style="cyan")
+        table.add_column("Hits", justify="right")
+        table.add_column("Misses", justify="right")
+        table.add_column("Hit ratio", justify="right")
+
+        for name, counts in sorted(caches.items()):
+            lookups = counts["hits"] + counts["misses"]
+            table.add_row(
+                name,
+                str(counts["hits"]),
+                str(counts["misses"]),
+                f"{counts['hits'] / lookups:.0%}" if lookups else "-",
+            )
+        console.print(table)
+
+    if not (endpoints or caches):
+        console.print("[dim]Nothing recorded yet.[/dim]")
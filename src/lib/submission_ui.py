@@ -1,13 +1,18 @@
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
 import typer
 from rich import box
 from rich.columns import Columns
 from rich.console import Console
+from rich.live import Live
+from rich.markup import escape
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
 
 from ..server.config import STATUS_CODES
+from ..server.timings import span, timed
 
 console = Console()
 
@@ -77,6 +82,19 @@ def display_submission_details(problem, problem_name, lang, file):
     return typer.confirm("Do you want to submit this solution?")
 
 
+def display_batch_details(jobs: List[Dict[str, Any]]):
+    """List the solutions of a batch and ask for confirmation"""
+    table = Table(title="Batch Submission", box=box.ROUNDED, border_style="blue")
+    table.add_column("File", style="cyan")
+    table.add_column("Problem")
+    table.add_column("Language")
+    for job in jobs:
+        table.add_row(str(job["file"]), job["problem"], job["lang"])
+    console.print(table)
+
+    return typer.confirm(f"Do you want to submit these {len(jobs)} solutions?")
+
+
 def display_submission_canceled():
     """Display submission canceled message"""
     console.print("[yellow]Submission canceled[/]")
@@ -91,6 +109,253 @@ def create_submission_progress():
     )
 
 
+BATCH_PENDING_STATES = {
+    "queued": "[dim]Queued[/]",
+    "submitting": "[cyan]Submitting...[/]",
+    "judging": "[cyan]Judging...[/]",
+}
+
+
+def create_batch_table(jobs: List[Dict[str, Any]]) -> Table:
+    """Build the table of a batch submission, one row per solution"""
+    table = Table(title="Batch Submission", box=box.ROUNDED, title_style="bold")
+    table.add_column("File", style="cyan")
+    table.add_column("Problem")
+    table.add_column("Status")
+    table.add_column("Runtime", justify="right")
+    table.add_column("Memory", justify="right")
+    table.add_column("Tests", justify="right")
+
+    for job in jobs:
+        result = job.get("result")
+        if result is None:
+            table.add_row(
+                str(job["file"]),
+                job["problem"],
+                BATCH_PENDING_STATES[job["state"]],
+                "",
+                "",
+                "",
+            )
+            continue
+
+        if result.get("error") and not result.get("status_code"):
+            table.add_row(
+                str(job["file"]),
+                job["problem"],
+                f"[bold red]{result['error']}[/]",
+                "",
+                "",
+                "",
+            )
+            continue
+
+        status, run_success = _determine_status(result, is_test=False)
+        status_style, _, emoji = _get_status_styling(
+            status, result.get("status_code"), run_success, False, result
+        )
+        cached = " [dim](cached)[/]" if result.get("cached_at") else ""
+        table.add_row(
+            str(job["file"]),
+            job["problem"],
+            f"{emoji} [{status_style}]{status}[/]{cached}",
+            str(result.get("status_runtime", "N/A")),
+            str(result.get("status_memory", "N/A")),
+            _format_test_case_stats(result),
+        )
+    return table
+
+
+def create_batch_live(jobs: List[Dict[str, Any]]) -> Live:
+    """Create a live display of the batch table, refreshed as verdicts arrive"""
+    return Live(create_batch_table(jobs), console=console, refresh_per_second=4)
+
+
+def display_batch_summary(accepted: int, total: int):
+    """Display how many solutions of a batch were accepted"""
+    style = "bold green" if accepted == total else "bold yellow"
+    console.print()
+    console.print(f"[{style}]{accepted}/{total} solutions accepted[/]")
+
+
+LOCAL_STATUSES = {
+    "passed": "[bold green]✅ Passed[/]",
+    "failed": "[bold yellow]≠ Differs[/]",
+    "error": "[bold yellow]⚠️ Runtime Error[/]",
+    "timeout": "[bold yellow]⚠️ Time Limit Exceeded[/]",
+    "unchecked": "[dim]Ran, no expected output[/]",
+}
+
+
+def display_local_results(cases: List[Dict[str, Any]]):
+    """Display the verdict of each example run locally"""
+    table = Table(title="Local Run", box=box.ROUNDED, title_style="bold")
+    table.add_column("#", justify="right", style="dim")
+    table.add_column("Input", style="cyan", overflow="fold")
+    table.add_column("Expected", overflow="fold")
+    table.add_column("Output", overflow="fold")
+    table.add_column("Status")
+    table.add_column("Time", justify="right")
+
+    for number, case in enumerate(cases, 1):
+        elapsed = case.get("elapsed")
+        table.add_row(
+            str(number),
+            "\n".join(case["input"]),
+            case["expected"] or "-",
+            case["output"] or "-",
+            LOCAL_STATUSES[case["status"]],
+            f"{elapsed * 1000:.1f} ms" if elapsed is not None else "-",
+        )
+    console.print(table)
+
+    for number, case in enumerate(cases, 1):
+        if case["error"]:
+            console.print(
+                Panel(
+                    f"[yellow]{escape(case['error'])}[/]",
+                    title=f"⚠️ Case {number}",
+                    border_style="yellow",
+                    box=box.ROUNDED,
+                    padding=(1, 1),
+                )
+            )
+        if case["stdout"].strip():
+            console.print(
+                Panel(
+                    escape(case["stdout"].strip()),
+                    title=f"📝 Standard Output of Case {number}",
+                    border_style="blue",
+                    box=box.ROUNDED,
+                    padding=(1, 1),
+                )
+            )
+
+    if any(case["status"] == "failed" for case in cases):
+        console.print(
+            "[yellow]Some outputs differ from the examples. They may still be "
+            "right when any order is accepted, so the judge runs anyway.[/]"
+        )
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.1f} ms"
+    return f"{seconds * 1e6:.0f} µs"
+
+
+def display_complexity_report(report: Dict[str, Any]):
+    """Display the timings of a complexity profile and what they predict"""
+    table = Table(title="Local Timings", box=box.ROUNDED, title_style="bold")
+    table.add_column("n", justify="right", style="cyan")
+    table.add_column("Time", justify="right")
+    for n, seconds in report["samples"]:
+        table.add_row(f"{n:,}", _format_seconds(seconds))
+    console.print(table)
+
+    if report["stopped"]:
+        console.print(f"[dim]Profiling {report['stopped']}[/]")
+
+    if not report["complexity"]:
+        console.print("[yellow]Too few sizes ran to estimate the complexity[/]")
+        return
+
+    limit = report["time_limit"]
+    content = [f"[bold cyan]Estimated complexity:[/] {report['complexity']}"]
+    if report["limit_size"]:
+        content.append(
+            f"[bold cyan]Reaches {limit:g} s at:[/] n ≈ {report['limit_size']:,}"
+        )
+    if report["max_size"]:
+        predicted = report["predicted"]
+        style = "green" if predicted < limit / 10 else "yellow"
+        if predicted > limit:
+            style = "bold red"
+        content.append(
+            f"[bold cyan]At the largest allowed n ({report['max_size']:,}):[/] "
+            f"[{style}]{_format_seconds(predicted)}[/]"
+        )
+        if predicted > limit:
+            content.append("[bold red]Likely Time Limit Exceeded[/]")
+
+    console.print(
+        Panel(
+            "\n".join(content),
+            title="⏱️ Complexity",
+            border_style="blue",
+            box=box.ROUNDED,
+            padding=(1, 2),
+        )
+    )
+
+
+def display_memory_report(report: Dict[str, Any]):
+    """Display the peak memory of a local run against LeetCode's thresholds"""
+    if report["error"]:
+        console.print(
+            Panel(
+                f"[yellow]{escape(report['error'])}[/]",
+                title=f"⚠️ Memory profile at n={report['size']:,} failed",
+                border_style="yellow",
+                box=box.ROUNDED,
+                padding=(1, 1),
+            )
+        )
+        return
+
+    peak = report["peak"]
+    if peak > report["limit_threshold"]:
+        style, verdict = "bold red", "Likely Memory Limit Exceeded"
+    elif peak > report["warning_threshold"]:
+        style, verdict = "bold yellow", "High memory usage"
+    else:
+        style, verdict = "bold green", "Within limits"
+
+    content = [
+        f"[bold cyan]Input size:[/] n = {report['size']:,}",
+        f"[bold cyan]Peak allocated:[/] [{style}]{peak / 1000000:.2f} MB[/] "
+        f"({verdict}; warning at {report['warning_threshold'] / 1000000:.0f} MB, "
+        f"limit {report['limit_threshold'] / 1000000:.0f} MB)",
+    ]
+    if report["peak_rss"]:
+        content.append(
+            "[bold cyan]Process peak RSS (with tracing):[/] "
+            f"{report['peak_rss'] / 1000000:.2f} MB"
+        )
+    console.print(
+        Panel(
+            "\n".join(content),
+            title="📝 Memory",
+            border_style=style.split()[-1],
+            box=box.ROUNDED,
+            padding=(1, 2),
+        )
+    )
+
+    if report["top"]:
+        table = Table(title="Top Allocation Sites", box=box.ROUNDED)
+        table.add_column("Line", justify="right", style="cyan")
+        table.add_column("Code")
+        table.add_column("Size", justify="right")
+        table.add_column("Blocks", justify="right")
+        for site in report["top"]:
+            table.add_row(
+                str(site["line"]),
+                escape(site["code"]),
+                f"{site['size'] / 1000000:.2f} MB",
+                f"{site['count']:,}",
+            )
+        console.print(table)
+
+
+def display_local_unsupported(reason: str):
+    """Explain why the local run was skipped"""
+    console.print(f"[yellow]Skipping the local run: {reason}[/]")
+
+
+@timed("ui.submission_results")
 def display_submission_results(result: Dict[str, Any], is_test: bool = False):
     """Display submission results with a cleaner layout"""
     status_code = result.get("status_code")
@@ -108,16 +373,17 @@ def display_submission_results(result: Dict[str, Any], is_test: bool = False):
 
     # Display the main result panel
     title = f"{emoji} {'Test' if is_test else 'Submission'} Result"
-    console.print(
-        Panel(
-            "\n".join(content_parts),
-            title=title,
-            title_align="center",
-            border_style=border_style,
-            box=box.ROUNDED,
-            padding=(1, 2),
+    with span("ui.submission.panel"):
+        console.print(
+            Panel(
+                "\n".join(content_parts),
+                title=title,
+                title_align="center",
+                border_style=border_style,
+                box=box.ROUNDED,
+                padding=(1, 2),
+            )
         )
-    )
 
     # Display additional details based on status
     _display_error_details(result, status, status_code)
@@ -125,6 +391,7 @@ def display_submission_results(result: Dict[str, Any], is_test: bool = False):
     _display_stdout(result)
     _display_output_comparison(result, status, run_success)
     _display_general_error(result, run_success, status)
+    _display_cached_notice(result)
 
 
 def _determine_status(result: Dict[str, Any], is_test: bool) -> Tuple[str, bool]:
@@ -173,6 +440,7 @@ def _get_status_styling(
         return "bold red", "red", "❌"
 
 
+@timed("ui.submission.summary")
 def _build_content_parts(
     result: Dict[str, Any], status: str, run_success: bool, status_style: str
 ) -> List[str]:
@@ -232,6 +500,7 @@ def _format_test_case_stats(result: Dict[str, Any]) -> str:
         return f"[bold red]{stats}[/]"
 
 
+@timed("ui.submission.error_details")
 def _display_error_details(
     result: Dict[str, Any], status: str, status_code: Optional[int]
 ) -> None:
@@ -293,6 +562,7 @@ def _display_error_details(
             )
 
 
+@timed("ui.submission.memory_warning")
 def _display_memory_warning(result: Dict[str, Any]) -> None:
     """Display memory warning if needed"""
     memory_value = result.get("memory", 0)
@@ -309,6 +579,7 @@ def _display_memory_warning(result: Dict[str, Any]) -> None:
         )
 
 
+@timed("ui.submission.stdout")
 def _display_stdout(result: Dict[str, Any]) -> None:
     """Display standard output if available"""
     stdout_lines = []
@@ -347,6 +618,7 @@ def _display_stdout(result: Dict[str, Any]) -> None:
         )
 
 
+@timed("ui.submission.output_comparison")
 def _display_output_comparison(
     result: Dict[str, Any], status: str, run_success: bool
 ) -> None:
@@ -424,6 +696,7 @@ def _display_output_comparison(
         console.print(Columns([output_panel, expected_panel]))
 
 
+@timed("ui.submission.general_error")
 def _display_general_error(
     result: Dict[str, Any], run_success: bool, status: str
 ) -> None:
@@ -455,7 +728,34 @@ def _display_general_error(
             )
 
 
+def display_watch_header(file):
+    """Separate the runs of `lc test --watch`"""
+    console.rule(f"[bold]{file}[/] [dim]{time.strftime('%H:%M:%S')}[/]")
+
+
+def display_watch_waiting(file):
+    console.print(f"[dim]👀 Watching {file} for changes (Ctrl+C to stop)[/]")
+
+
+def display_watch_canceled():
+    console.print("[yellow]↻ File changed; abandoning this run[/]")
+
+
+def display_watch_stopped():
+    console.print("[dim]Stopped watching[/]")
+
+
 def display_exception_error(e):
     """Display exception error message"""
     console.print(Panel(f"❌ Error: {str(e)}", style="bold red", border_style="red"))
     raise typer.Exit(1)
+
+
+def _display_cached_notice(result: Dict[str, Any]) -> None:
+    """Say when a verdict came from the result cache rather than the judge"""
+    if result.get("cached_at"):
+        judged_at = time.strftime("%Y-%m-%d %H:%M", time.localtime(result["cached_at"]))
+        console.print(
+            f"[dim]♻️  Cached verdict for identical code, judged {judged_at}; "
+            "use --no-cache to run the judge again[/]"
+        )
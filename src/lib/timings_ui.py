@@ -0,0 +1,33 @@
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from ..server.timings import elapsed, summary
+
+console = Console(stderr=True)
+
+
+def display_timings():
+    """Print the time spent in each recorded phase of the command"""
+    rows = summary()
+    wall = elapsed()
+
+    table = Table(title="Timings", box=box.ROUNDED, title_style="bold")
+    table.add_column("Phase")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Max", justify="right")
+    table.add_column("Share", justify="right")
+
+    for row in rows:
+        table.add_row(
+            "  " * row["depth"] + row["name"],
+            str(row["calls"]),
+            f"{row['total'] * 1000:.1f} ms",
+            f"{row['max'] * 1000:.1f} ms",
+            f"{row['total'] / wall:.0%}" if wall else "-",
+        )
+
+    table.add_section()
+    table.add_row("wall time", "", f"{wall * 1000:.1f} ms", "", "100%", style="bold")
+    console.print(table)
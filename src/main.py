@@ -1,34 +1,111 @@
+import importlib
+
 import typer
+from typer.core import TyperCommand, TyperGroup
+
+# name -> (module, attribute, help shown in `lc --help`)
+COMMANDS = {
+    "show": (
+        "src.commands.show",
+        "show",
+        "Show problem details including description and test cases",
+    ),
+    "list": (
+        "src.commands.list_problems",
+        "list_problems",
+        "List available LeetCode problems with optional filters.",
+    ),
+    "daily": (
+        "src.commands.daily",
+        "daily",
+        "Get and work on today's LeetCode daily challenge.",
+    ),
+    "profile": ("src.commands.profile", "profile", "Show your LeetCode profile."),
+    "login": ("src.commands.login", "login", "Login to LeetCode"),
+    "logout": ("src.commands.login", "logout", "Logout from LeetCode"),
+    "submit": ("src.commands.submit", "submit", "Submit a solution to LeetCode"),
+    "submit-batch": (
+        "src.commands.submit",
+        "submit_batch",
+        "Submit many solutions to LeetCode at once",
+    ),
+    "test": ("src.commands.test", "test", "Test a solution with LeetCode's test cases"),
+    "edit": (
+        "src.commands.edit",
+        "edit",
+        "Solves a problem by passing lang param and open it with your code editor.",
+    ),
+    "solutions": ("src.commands.solution", "solutions", "Fetch solution for a problem"),
+    "sync": (
+        "src.commands.sync",
+        "sync",
+        "Download problems into the local cache for offline use",
+    ),
+    "debug": ("src.commands.debug", "debug_app", "Inspect the CLI's own behaviour"),
+}
+
+
+def load_command(name: str) -> TyperCommand:
+    """Import a registered command's module and build its click command"""
+    module_path, attribute, _ = COMMANDS[name]
+    function = getattr(importlib.import_module(module_path), attribute)
+    if isinstance(function, typer.Typer):
+        # A sub-app with commands of its own, such as `lc debug`
+        return typer.main.get_command(function)
+    single = typer.Typer(add_completion=False)
+    single.command(name=name)(function)
+    return typer.main.get_command(single)
+
+
+class LazyGroup(TyperGroup):
+    """Command group that imports a command's module only when it is dispatched
+
+    Until then each command is a placeholder carrying the registry help, which
+    is all that listing commands, `--help` and suggestions need.
+    """
+
+    def __init__(self, **attrs):
+        super().__init__(**attrs)
+        for name, (_, _, help) in COMMANDS.items():
+            self.commands.setdefault(name, TyperCommand(name, help=help))
 
-from src.commands.daily import daily
-from src.commands.edit import edit
-from src.commands.list_problems import list_problems
-from src.commands.login import login, logout
-from src.commands.profile import profile
-from src.commands.show import show
-from src.commands.solution import solutions
-from src.commands.submit import submit
-from src.commands.test import test
-from src.lib.welcome import display_welcome
-
-app = typer.Typer()
-
-app.command(name="show")(show)
-app.command(name="list")(list_problems)
-app.command(name="daily")(daily)
-app.command(name="profile")(profile)
-app.command(name="login")(login)
-app.command(name="logout")(logout)
-app.command(name="submit")(submit)
-app.command(name="test")(test)
-app.command(name="edit")(edit)
-app.command(name="solutions")(solutions)
+    def resolve_command(self, ctx, args):
+        cmd_name, cmd, args = super().resolve_command(ctx, args)
+        if cmd_name in COMMANDS:
+            cmd = self.commands[cmd_name] = load_command(cmd_name)
+        return cmd_name, cmd, args
+
+
+app = typer.Typer(cls=LazyGroup)
 
 
 @app.callback(invoke_without_command=True)
-def callback(ctx: typer.Context):
+def callback(
+    ctx: typer.Context,
+    offline: bool = typer.Option(
+        False, "--offline", help="Answer from the local cache without the network"
+    ),
+    timings: bool = typer.Option(
+        False, "--timings", help="Print how long each phase of the command took"
+    ),
+):
     """LeetCode CLI - A command-line tool for LeetCode problems."""
+    if timings:
+        from src.lib.timings_ui import display_timings
+        from src.server.timings import keep_spans
+
+        keep_spans()
+
+        ctx.call_on_close(display_timings)
+
+    if offline:
+        from src.server.transport import set_offline
+
+        set_offline()
+
     if ctx.invoked_subcommand is None:
+        from src.lib.welcome import display_welcome
+
         display_welcome(app)
         typer.echo(ctx.get_help())
 
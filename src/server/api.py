@@ -1,25 +1,226 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 import typer
-from gql import Client, gql
-from gql.transport.requests import RequestsHTTPTransport
 
+from ..server.cache import CacheMissError, ResponseCache
+from ..server.catalog import ProblemCatalog
+from ..server.graphql import GraphQLError, execute, post, register
 from ..server.session_manager import SessionManager
+from ..server.transport import get_session, set_auth_cookies
+
+PROFILE_QUERIES = {
+    "userProfile": register(
+        """
+  query userPublicProfile($username: String!) {
+    matchedUser(username: $username) {
+      contestBadge { name expired hoverText icon }
+      username githubUrl twitterUrl linkedinUrl
+      profile {
+        ranking userAvatar realName aboutMe school websites
+        countryName company jobTitle skillTags postViewCount
+        postViewCountDiff reputation reputationDiff solutionCount
+        solutionCountDiff categoryDiscussCount categoryDiscussCountDiff
+        certificationLevel
+      }
+    }
+  }
+"""
+    ),
+    "languageStats": register(
+        """
+  query languageStats($username: String!) {
+    matchedUser(username: $username) {
+      languageProblemCount {
+        languageName
+        problemsSolved
+      }
+    }
+  }
+"""
+    ),
+    "skillStats": register(
+        """
+  query skillStats($username: String!) {
+    matchedUser(username: $username) {
+      tagProblemCounts {
+        advanced { tagName tagSlug problemsSolved }
+        intermediate { tagName tagSlug problemsSolved }
+        fundamental { tagName tagSlug problemsSolved }
+      }
+    }
+  }
+"""
+    ),
+    "contestInfo": register(
+        """
+  query userContestRankingInfo($username: String!) {
+    userContestRanking(username: $username) {
+      attendedContestsCount rating globalRanking
+      totalParticipants topPercentage
+      badge { name }
+    }
+    userContestRankingHistory(username: $username) {
+      attended trendDirection problemsSolved totalProblems
+      finishTimeInSeconds rating ranking
+      contest { title startTime }
+    }
+  }
+"""
+    ),
+    "progress": register(
+        """
+  query userSessionProgress($username: String!) {
+    allQuestionsCount { difficulty count }
+    matchedUser(username: $username) {
+      submitStats {
+        acSubmissionNum { difficulty count submissions }
+        totalSubmissionNum { difficulty count submissions }
+      }
+    }
+  }
+"""
+    ),
+    "calendar": register(
+        """
+  query userProfileCalendar($username: String!, $year: Int) {
+    matchedUser(username: $username) {
+      userCalendar(year: $year) {
+        activeYears streak totalActiveDays
+        dccBadges { timestamp badge { name icon } }
+        submissionCalendar
+      }
+    }
+  }
+"""
+    ),
+    "recentAcSubmissions": register(
+        """
+  query recentAcSubmissions($username: String!, $limit: Int!) {
+    recentAcSubmissionList(username: $username, limit: $limit) {
+      id
+      title
+      titleSlug
+      timestamp
+    }
+  }
+"""
+    ),
+}
 
 
-def create_leetcode_client(csrf_token: str, session_id: str):
-    headers = {
-        "Content-Type": "application/json",
-        "x-csrftoken": csrf_token,
-        "cookie": f"csrftoken={csrf_token}; LEETCODE_SESSION={session_id}",
-        "referer": "https://leetcode.com",
+PROFILE_DASHBOARD_QUERY = register(
+    """
+  query userProfileDashboard($username: String!, $limit: Int!, $year: Int) {
+    userProfile: matchedUser(username: $username) {
+      contestBadge { name expired hoverText icon }
+      username githubUrl twitterUrl linkedinUrl
+      profile {
+        ranking userAvatar realName aboutMe school websites
+        countryName company jobTitle skillTags postViewCount
+        postViewCountDiff reputation reputationDiff solutionCount
+        solutionCountDiff categoryDiscussCount categoryDiscussCountDiff
+        certificationLevel
+      }
+    }
+    languageStats: matchedUser(username: $username) {
+      languageProblemCount { languageName problemsSolved }
+    }
+    skillStats: matchedUser(username: $username) {
+      tagProblemCounts {
+        advanced { tagName tagSlug problemsSolved }
+        intermediate { tagName tagSlug problemsSolved }
+        fundamental { tagName tagSlug problemsSolved }
+      }
+    }
+    userContestRanking(username: $username) {
+      attendedContestsCount rating globalRanking
+      totalParticipants topPercentage
+      badge { name }
+    }
+    userContestRankingHistory(username: $username) {
+      attended trendDirection problemsSolved totalProblems
+      finishTimeInSeconds rating ranking
+      contest { title startTime }
+    }
+    allQuestionsCount { difficulty count }
+    progress: matchedUser(username: $username) {
+      submitStats {
+        acSubmissionNum { difficulty count submissions }
+        totalSubmissionNum { difficulty count submissions }
+      }
+    }
+    calendar: matchedUser(username: $username) {
+      userCalendar(year: $year) {
+        activeYears streak totalActiveDays
+        dccBadges { timestamp badge { name icon } }
+        submissionCalendar
+      }
+    }
+    recentAcSubmissionList(username: $username, limit: $limit) {
+      id
+      title
+      titleSlug
+      timestamp
     }
+  }
+"""
+)
 
-    transport = RequestsHTTPTransport(
-        url="https://leetcode.com/graphql",
-        headers=headers,
-    )
+# Top-level field of PROFILE_DASHBOARD_QUERY -> (section, key) it fills in the
+# per-section results that display_user_stats expects.
+PROFILE_DASHBOARD_FIELDS = {
+    "userProfile": ("userProfile", "matchedUser"),
+    "languageStats": ("languageStats", "matchedUser"),
+    "skillStats": ("skillStats", "matchedUser"),
+    "userContestRanking": ("contestInfo", "userContestRanking"),
+    "userContestRankingHistory": ("contestInfo", "userContestRankingHistory"),
+    "allQuestionsCount": ("progress", "allQuestionsCount"),
+    "progress": ("progress", "matchedUser"),
+    "calendar": ("calendar", "matchedUser"),
+    "recentAcSubmissionList": ("recentAcSubmissions", "recentAcSubmissionList"),
+}
+
+
+def _split_profile_sections(data: dict, errors: list) -> dict:
+    """Rebuild per-section results from one aliased response.
+
+    A section whose fields reported an error is set to None on its own, so
+    one failing field does not blank the rest of the dashboard.
+    """
+    failed = {}
+    for error in errors or []:
+        path = error.get("path") or []
+        if path and path[0] in PROFILE_DASHBOARD_FIELDS:
+            section = PROFILE_DASHBOARD_FIELDS[path[0]][0]
+            failed.setdefault(section, error.get("message", "Unknown error"))
+
+    results = {}
+    for field, (section, key) in PROFILE_DASHBOARD_FIELDS.items():
+        if section in failed:
+            results[section] = None
+            continue
+        results.setdefault(section, {})[key] = data.get(field)
+
+    for section, message in failed.items():
+        print(f"Error fetching {section}: {message}")
 
-    return Client(transport=transport, fetch_schema_from_transport=False)
+    return results
+
+
+def _fetch_profile_sections(username: str) -> dict:
+    """Fetch every profile section as its own query, concurrently"""
+
+    def fetch(name, operation):
+        try:
+            return name, execute(operation, {"username": username, "limit": 10})
+        except Exception as e:
+            print(f"Error fetching {name}: {str(e)}")
+            return name, None
+
+    with ThreadPoolExecutor(max_workers=len(PROFILE_QUERIES)) as executor:
+        return dict(executor.map(lambda item: fetch(*item), PROFILE_QUERIES.items()))
 
 
 def fetch_user_profile():
@@ -34,103 +235,61 @@ def fetch_user_profile():
         )
         raise typer.Exit(1)
 
-    client = create_leetcode_client("csrf_token", "session_id")
-    queries = {
-        "userProfile": """
-      query userPublicProfile($username: String!) {
-        matchedUser(username: $username) {
-          contestBadge { name expired hoverText icon }
-          username githubUrl twitterUrl linkedinUrl
-          profile {
-            ranking userAvatar realName aboutMe school websites
-            countryName company jobTitle skillTags postViewCount
-            postViewCountDiff reputation reputationDiff solutionCount
-            solutionCountDiff categoryDiscussCount categoryDiscussCountDiff
-            certificationLevel
-          }
-        }
-      }
-    """,
-        "languageStats": """
-      query languageStats($username: String!) {
-        matchedUser(username: $username) {
-          languageProblemCount {
-            languageName
-            problemsSolved
-          }
-        }
-      }
-    """,
-        "skillStats": """
-      query skillStats($username: String!) {
-        matchedUser(username: $username) {
-          tagProblemCounts {
-            advanced { tagName tagSlug problemsSolved }
-            intermediate { tagName tagSlug problemsSolved }
-            fundamental { tagName tagSlug problemsSolved }
-          }
-        }
-      }
-    """,
-        "contestInfo": """
-      query userContestRankingInfo($username: String!) {
-        userContestRanking(username: $username) {
-          attendedContestsCount rating globalRanking
-          totalParticipants topPercentage
-          badge { name }
-        }
-        userContestRankingHistory(username: $username) {
-          attended trendDirection problemsSolved totalProblems
-          finishTimeInSeconds rating ranking
-          contest { title startTime }
-        }
-      }
-    """,
-        "progress": """
-      query userSessionProgress($username: String!) {
-        allQuestionsCount { difficulty count }
-        matchedUser(username: $username) {
-          submitStats {
-            acSubmissionNum { difficulty count submissions }
-            totalSubmissionNum { difficulty count submissions }
-          }
-        }
-      }
-    """,
-        "calendar": """
-      query userProfileCalendar($username: String!, $year: Int) {
-        matchedUser(username: $username) {
-          userCalendar(year: $year) {
-            activeYears streak totalActiveDays
-            dccBadges { timestamp badge { name icon } }
-            submissionCalendar
-          }
-        }
-      }
-    """,
-        "recentAcSubmissions": """
-      query recentAcSubmissions($username: String!, $limit: Int!) {
-        recentAcSubmissionList(username: $username, limit: $limit) {
+    return ResponseCache().fetch(
+        f"userProfile:{username}",
+        lambda: _fetch_user_profile(username),
+        label=f"The profile of {username}",
+    )
+
+
+def _fetch_user_profile(username: str) -> dict:
+    try:
+        data = execute(PROFILE_DASHBOARD_QUERY, {"username": username, "limit": 10})
+        return _split_profile_sections(data, [])
+    except GraphQLError as e:
+        if e.data:
+            return _split_profile_sections(e.data, e.errors)
+    except requests.ConnectionError:
+        raise
+    except Exception:
+        pass
+
+    # The combined document was rejected as a whole; isolate each section
+    return _fetch_profile_sections(username)
+
+
+PROBLEM_LIST_QUERY = register(
+    """
+  query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {
+    problemsetQuestionList: questionList(
+      categorySlug: $categorySlug
+      limit: $limit
+      skip: $skip
+      filters: $filters
+    ) {
+      total: totalNum
+      questions: data {
+        acRate
+        difficulty
+        freqBar
+        frontendQuestionId: questionFrontendId
+        isFavor
+        paidOnly: isPaidOnly
+        status
+        title
+        titleSlug
+        topicTags {
+          name
           id
-          title
-          titleSlug
-          timestamp
+          slug
         }
+        hasSolution
+        hasVideoSolution
       }
-    """,
     }
-
-    results = {}
-    for name, query in queries.items():
-        try:
-            results[name] = client.execute(
-                gql(query), variable_values={"username": username, "limit": 10}
-            )
-        except Exception as e:
-            print(f"Error fetching {name}: {str(e)}")
-            results[name] = None
-
-    return results
+  }
+"""
+)
 
 
 def fetch_problem_list(
@@ -144,7 +303,9 @@ def fetch_problem_list(
     if filters and "difficulty" in filters and filters["difficulty"]:
         filters["difficulty"] = filters["difficulty"].upper()
 
-    client = create_leetcode_client(csrf_token, session_id)
+    if csrf_token and session_id:
+        set_auth_cookies(get_session(), csrf_token, session_id)
+
     variables = {
         "categorySlug": categorySlug,
         "limit": limit,
@@ -152,50 +313,69 @@ def fetch_problem_list(
         "filters": filters,
     }
 
-    query = gql(
-        """
-        query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {
-            problemsetQuestionList: questionList(
-                categorySlug: $categorySlug
-                limit: $limit
-                skip: $skip
-                filters: $filters
-            ) {
-                total: totalNum
-                questions: data {
-                    acRate
-                    difficulty
-                    freqBar
-                    frontendQuestionId: questionFrontendId
-                    isFavor
-                    paidOnly: isPaidOnly
-                    status
-                    title
-                    titleSlug
-                    topicTags {
-                        name
-                        id
-                        slug
-                    }
-                    hasSolution
-                    hasVideoSolution
-                }
-            }
-        }
-        """
-    )
-
     try:
-        result = client.execute(query, variable_values=variables)
-        return result
+        return ResponseCache().fetch(
+            f"problemsetQuestionList:{json.dumps(variables, sort_keys=True)}",
+            lambda: execute(PROBLEM_LIST_QUERY, variables),
+            label="This problem list",
+        )
+    except CacheMissError as e:
+        fallback = _problem_list_from_catalog(limit, skip, filters)
+        if fallback is not None:
+            return fallback
+        print(f"Error fetching data: {str(e)}")
+        return None
     except Exception as e:
         print(f"Error fetching data: {str(e)}")
         return None
 
 
-def get_daily_question():
-    url = "https://leetcode.com/graphql"
-    query = """
+def _problem_list_from_catalog(limit: int, skip: int, filters: dict):
+    """Answer an uncached problem list from the catalog index when possible
+
+    The index only knows difficulty, so status and tag filters cannot be
+    served from it.
+    """
+    if filters.get("status") or filters.get("tags"):
+        return None
+
+    try:
+        index = ProblemCatalog().ensure()
+    except Exception:
+        return None
+
+    difficulty = (filters.get("difficulty") or "").capitalize()
+    problems = sorted(
+        (
+            (slug, problem)
+            for slug, problem in index["by_slug"].items()
+            if not difficulty or problem["difficulty"] == difficulty
+        ),
+        key=lambda item: int(item[1]["frontend_id"]),
+    )
+
+    return {
+        "problemsetQuestionList": {
+            "total": len(problems),
+            "questions": [
+                {
+                    "acRate": problem.get("ac_rate", 0.0),
+                    "difficulty": problem["difficulty"],
+                    "frontendQuestionId": problem["frontend_id"],
+                    "paidOnly": problem["paid_only"],
+                    "status": None,
+                    "title": problem["title"],
+                    "titleSlug": slug,
+                    "topicTags": [],
+                }
+                for slug, problem in problems[skip : skip + limit]
+            ],
+        }
+    }
+
+
+DAILY_QUESTION_QUERY = register(
+    """
   query questionOfToday {
     activeDailyCodingChallengeQuestion {
       date
@@ -222,6 +402,13 @@ def get_daily_question():
       }
     }
   }
-  """
-    response = requests.post(url, json={"query": query})
-    return response.json()
+"""
+)
+
+
+def get_daily_question():
+    return ResponseCache().fetch(
+        "questionOfToday",
+        lambda: post(DAILY_QUESTION_QUERY),
+        label="The daily challenge",
+    )
@@ -0,0 +1,142 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Dict, Iterable, List, Optional
+
+from . import api
+from .config import (
+    HTTP_POOL_MAXSIZE,
+    SUBMISSION_RESULT_TIMEOUT,
+    TEST_RESULT_TIMEOUT,
+)
+from .solution_manager import SolutionManager
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=HTTP_POOL_MAXSIZE, thread_name_prefix="leetcode-io"
+        )
+    return _executor
+
+
+async def _run(func, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+
+
+async def gather_limited(aws: Iterable[Awaitable], limit: int) -> List[Any]:
+    """Await many coroutines with at most `limit` running at once"""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(bounded(aw) for aw in aws))
+
+
+class AsyncLeetCodeClient:
+    """Async counterpart of the `api` functions and `SolutionManager`.
+
+    Blocking calls run on a thread pool sized to the shared HTTP connection
+    pool, so many fetches can be awaited together on one event loop while
+    still reusing the pooled session, cookies and caches of the sync API.
+    """
+
+    def __init__(self, solution_manager: Optional[SolutionManager] = None):
+        self.solution_manager = solution_manager or SolutionManager()
+
+    async def get_question_data(
+        self, question_identifier: str, refresh: bool = False
+    ) -> Dict[str, Any]:
+        return await _run(
+            self.solution_manager.get_question_data, question_identifier, refresh
+        )
+
+    async def get_problem_solutions(
+        self, question_identifier: str, best: bool = False
+    ) -> Dict[str, Any]:
+        return await _run(
+            self.solution_manager.get_problem_solutions, question_identifier, best
+        )
+
+    async def fetch_problem_list(self, *args, **kwargs):
+        return await _run(api.fetch_problem_list, *args, **kwargs)
+
+    async def fetch_user_profile(self):
+        return await _run(api.fetch_user_profile)
+
+    async def get_daily_question(self):
+        return await _run(api.get_daily_question)
+
+    async def poll_result(self, submission_id: str, timeout: int) -> Dict[str, Any]:
+        """Wait for a judge result from the shared poller without blocking"""
+        return await asyncio.wrap_future(
+            self.solution_manager.watch_result(submission_id, timeout)
+        )
+
+    async def start_submission(
+        self, title_slug: str, code: str, lang: str = "python3"
+    ) -> Dict[str, Any]:
+        return await _run(
+            self.solution_manager.start_submission, title_slug, code, lang
+        )
+
+    async def cached_result(self, kind: str, title_slug: str, code: str, lang: str):
+        return await _run(
+            self.solution_manager.cached_result, kind, title_slug, code, lang
+        )
+
+    async def submit_solution(
+        self, title_slug: str, code: str, lang: str = "python3", use_cache: bool = True
+    ) -> Dict[str, Any]:
+        if use_cache:
+            cached = await self.cached_result("submit", title_slug, code, lang)
+            if cached:
+                return cached
+
+        started = await self.start_submission(title_slug, code, lang)
+        if not started["success"]:
+            return started
+        result = await self.poll_result(
+            started["submission_id"], SUBMISSION_RESULT_TIMEOUT
+        )
+        self.solution_manager.remember_result("submit", started, code, lang, result)
+        return result
+
+    async def test_solution(
+        self,
+        title_slug: str,
+        code: str,
+        lang: str = "python3",
+        full: bool = False,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        kind = "full" if full else "test"
+        if use_cache:
+            cached = await self.cached_result(kind, title_slug, code, lang)
+            if cached:
+                return cached
+
+        started = await _run(
+            self.solution_manager.start_test, title_slug, code, lang, full
+        )
+        if not started["success"]:
+            return started
+        result = await self.poll_result(started["submission_id"], TEST_RESULT_TIMEOUT)
+        self.solution_manager.remember_result(kind, started, code, lang, result)
+        return result
+
+
+async def get_question_data(
+    question_identifier: str, refresh: bool = False
+) -> Dict[str, Any]:
+    return await AsyncLeetCodeClient().get_question_data(question_identifier, refresh)
+
+
+async def fetch_problem_list(*args, **kwargs):
+    return await AsyncLeetCodeClient().fetch_problem_list(*args, **kwargs)
@@ -2,53 +2,73 @@ from typing import Any, Dict
 
 import requests
 
+from .config import LEETCODE_BASE_URL
+from .graphql import post, register
 from .session_manager import SessionManager
+from .timings import timed
+from .transport import COOKIE_DOMAIN, get_session, is_offline, set_auth_cookies
+
+USER_STATUS_QUERY = register("query userStatus { userStatus { isSignedIn username } }")
 
 
 class Auth:
     def __init__(self):
-        self.session = requests.Session()
-        self.BASE_URL = "https://leetcode.com"
+        self.session = get_session()
+        self.BASE_URL = LEETCODE_BASE_URL
         self.is_authenticated = False
         self.session_manager = SessionManager()
         self._load_saved_session()
 
+    @timed("auth.validate")
     def _load_saved_session(self):
         """Try to load and validate saved session"""
         saved_session = self.session_manager.load_session()
         if saved_session:
+            if is_offline() or self.session_manager.is_validation_fresh(saved_session):
+                self._set_session_cookies(
+                    saved_session["csrftoken"], saved_session["session_token"]
+                )
+                self.is_authenticated = True
+                return True
+
             result = self.login_with_session(
                 saved_session["csrftoken"], saved_session["session_token"]
             )
+            if not result["success"] and is_offline():
+                # Unverifiable without a network; keep using the saved session
+                self.is_authenticated = True
+                return True
             return result["success"]
         return False
 
+    def _set_session_cookies(self, csrf_token: str, leetcode_session: str):
+        """Attach the LeetCode auth cookies to the HTTP session"""
+        set_auth_cookies(self.session, csrf_token, leetcode_session)
+
+    def _fetch_user_status(self) -> Dict[str, Any]:
+        """Query the signed-in user with the smallest GraphQL document available"""
+        result = post(USER_STATUS_QUERY, session=self.session)
+        return (result.get("data") or {}).get("userStatus") or {}
+
     def verify_csrf_token(self, csrf_token: str) -> Dict[str, Any]:
         """Verify CSRF token by making a request to LeetCode's GraphQL endpoint"""
         try:
             if not csrf_token:
                 return {"success": False, "message": "CSRF token is required"}
 
-            self.session.cookies.set("csrftoken", csrf_token, domain="leetcode.com")
-
-            response = self.session.post(
-                f"{self.BASE_URL}/graphql",
-                json={"query": "query { userStatus { isSignedIn username } }"},
-                headers={
-                    "X-CSRFToken": csrf_token,
-                    "Accept": "application/json",
-                    "Content-Type": "application/json",
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                },
-            )
-
-            self.session.cookies.clear(domain="leetcode.com")
+            # Swap only the CSRF cookie on the shared session and put the old
+            # one back (None removes it), leaving LEETCODE_SESSION in place
+            cookies = self.session.cookies
+            previous = cookies.get("csrftoken", domain=COOKIE_DOMAIN)
+            cookies.set("csrftoken", csrf_token, domain=COOKIE_DOMAIN)
 
-            if response.status_code == 200:
-                data = response.json()
-                if "errors" not in data:
-                    return {"success": True, "message": "CSRF token verified"}
+            try:
+                data = post(USER_STATUS_QUERY, session=self.session)
+            finally:
+                cookies.set("csrftoken", previous, domain=COOKIE_DOMAIN)
 
+            if "errors" not in data:
+                return {"success": True, "message": "CSRF token verified"}
             return {"success": False, "message": "Invalid CSRF token"}
 
         except Exception as e:
@@ -65,35 +85,25 @@ class Auth:
                     "message": "Both CSRF and LEETCODE_SESSION tokens are required",
                 }
 
-            self.session.cookies.set(
-                "LEETCODE_SESSION", leetcode_session, domain="leetcode.com"
-            )
-
-            response = self.session.get(
-                f"{self.BASE_URL}/api/problems/all/",
-                headers={
-                    "X-CSRFToken": csrf_token,
-                    "Accept": "application/json",
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                },
-            )
+            self._set_session_cookies(csrf_token, leetcode_session)
 
-            if response.status_code == 200:
-                user_data = response.json()
-                if user_data.get("user_name"):
-                    self.is_authenticated = True
-                    self.session_manager.save_session(
-                        csrf_token, leetcode_session, user_data["user_name"]
-                    )
-                    return {
-                        "success": True,
-                        "message": "Successfully logged in",
-                        "user_name": user_data["user_name"],
-                    }
+            user_status = self._fetch_user_status()
+            if user_status.get("isSignedIn") and user_status.get("username"):
+                self.is_authenticated = True
+                self.session_manager.save_session(
+                    csrf_token, leetcode_session, user_status["username"]
+                )
+                return {
+                    "success": True,
+                    "message": "Successfully logged in",
+                    "user_name": user_status["username"],
+                }
 
             self.session_manager.clear_session()
             return {"success": False, "message": "Invalid session credentials"}
 
+        except requests.ConnectionError as e:
+            return {"success": False, "message": f"Login error: {str(e)}"}
         except Exception as e:
             self.session_manager.clear_session()
             return {"success": False, "message": f"Login error: {str(e)}"}
@@ -0,0 +1,248 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+import typer
+
+from .config import (
+    APP_NAME,
+    CACHE_EVICT_RATIO,
+    CACHEABLE_STATUS_CODES,
+    QUESTION_CACHE_MAX_BYTES,
+    QUESTION_CONTENT_TTL,
+    QUESTION_FIELD_TTLS,
+    RESPONSE_CACHE_MAX_BYTES,
+    RESULT_CACHE_MAX_BYTES,
+    RESULT_CACHE_TTL,
+)
+from .timings import span
+from .transport import is_offline
+
+
+class CacheMissError(Exception):
+    """Raised when the network is unavailable and nothing is cached"""
+
+
+class DiskCache:
+    """JSON file cache under the app dir, bounded in size with LRU eviction.
+
+    Recency is tracked through file modification times: every read touches
+    the entry, and eviction removes the least recently touched files first.
+    The size of the cache is scanned once and then kept as a running total,
+    so writes only pay for a scan when the cache outgrows its budget; it is
+    then trimmed to CACHE_EVICT_RATIO of the budget, leaving room for many
+    more writes before the next scan.
+    """
+
+    def __init__(self, namespace: str, max_bytes: int):
+        self.cache_dir = Path(typer.get_app_dir(APP_NAME)) / "cache" / namespace
+        self.max_bytes = max_bytes
+        self._size: Optional[int] = None
+        self._size_lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        with span("cache.get", namespace=self.cache_dir.name, key=key) as current:
+            try:
+                with open(path, "r") as f:
+                    entry = json.load(f)
+                os.utime(path)
+            except Exception:
+                entry = None
+            current.attrs["hit"] = entry is not None
+            return entry
+
+    def size(self) -> int:
+        """Bytes used by the cache, scanned on first use and then tracked"""
+        with self._size_lock:
+            if self._size is None:
+                self._size = sum(entry[1] for entry in self._entries())
+            return self._size
+
+    def _file_size(self, path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    def set(self, key: str, entry: Dict[str, Any]):
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        self.size()
+        with self._size_lock:
+            self._size += self._file_size(tmp_path) - self._file_size(path)
+            os.replace(tmp_path, path)
+            size = self._size
+        if size > self.max_bytes:
+            self.evict()
+
+    def delete(self, key: str):
+        path = self._path(key)
+        if path.exists():
+            with self._size_lock:
+                if self._size is not None:
+                    self._size -= self._file_size(path)
+                path.unlink()
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        """Drop least recently used entries down to CACHE_EVICT_RATIO of the budget
+
+        The directory is rescanned, which also corrects the running total
+        for entries other processes wrote or removed.
+        """
+        with self._size_lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            target = self.max_bytes * CACHE_EVICT_RATIO
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                except OSError:
+                    pass
+            self._size = total
+
+
+class QuestionCache:
+    """Persistent `questionData` cache with a TTL per question field.
+
+    Problem content is close to immutable and kept for QUESTION_CONTENT_TTL;
+    fields listed in QUESTION_FIELD_TTLS (such as `stats`) expire sooner.
+    """
+
+    def __init__(self, max_bytes: int = QUESTION_CACHE_MAX_BYTES):
+        self.store = DiskCache("questions", max_bytes)
+
+    def _ttl(self, field: str) -> float:
+        return QUESTION_FIELD_TTLS.get(field, QUESTION_CONTENT_TTL)
+
+    def get(self, title_slug: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry as `{"question": ..., "fetched_at": ...}`"""
+        entry = self.store.get(title_slug)
+        if not entry or not entry.get("question"):
+            return None
+        return entry
+
+    def stale_fields(self, entry: Dict[str, Any]) -> List[str]:
+        now = time.time()
+        return [
+            field
+            for field, fetched_at in entry.get("fetched_at", {}).items()
+            if now - fetched_at > self._ttl(field)
+        ]
+
+    def set(self, title_slug: str, question: Dict[str, Any]):
+        now = time.time()
+        self.store.set(
+            title_slug,
+            {"question": question, "fetched_at": {field: now for field in question}},
+        )
+
+    def update(self, title_slug: str, entry: Dict[str, Any], fields: Dict[str, Any]):
+        """Merge freshly fetched fields into an existing entry"""
+        now = time.time()
+        entry["question"].update(fields)
+        entry["fetched_at"].update({field: now for field in fields})
+        self.store.set(title_slug, entry)
+
+
+class ResponseCache:
+    """Last known good API responses, served when the network is unavailable"""
+
+    def __init__(self, max_bytes: int = RESPONSE_CACHE_MAX_BYTES):
+        self.store = DiskCache("responses", max_bytes)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.store.get(key)
+        return entry["value"] if entry else None
+
+    def fetch(
+        self, key: str, loader: Callable[[], Any], label: Optional[str] = None
+    ) -> Any:
+        """Return `loader()` and remember it, or the remembered copy if offline
+
+        Raises CacheMissError, described by `label`, when offline and `key`
+        was never stored.
+        """
+        if not is_offline():
+            try:
+                value = loader()
+            except requests.ConnectionError:
+                if not is_offline():
+                    raise
+                value = None
+
+            if value is not None:
+                self.store.set(key, {"stored_at": time.time(), "value": value})
+                return value
+            if not is_offline():
+                return value
+
+        entry = self.store.get(key)
+        if entry is None:
+            raise CacheMissError(f"{label or key} is not available offline")
+        return entry["value"]
+
+
+class ResultCache:
+    """Judge verdicts keyed by problem, language, code and test input
+
+    Code is compared after normalizing line endings and trailing
+    whitespace, so re-running an unchanged file answers instantly. Only
+    verdicts that do not vary from run to run are kept, and only for
+    RESULT_CACHE_TTL.
+    """
+
+    def __init__(self, max_bytes: int = RESULT_CACHE_MAX_BYTES):
+        self.store = DiskCache("results", max_bytes)
+
+    @staticmethod
+    def key(kind: str, title_slug: str, lang: str, code: str, data_input: str) -> str:
+        normalized = "\n".join(line.rstrip() for line in code.strip().splitlines())
+        return json.dumps(
+            [
+                kind,
+                title_slug,
+                lang,
+                hashlib.sha256(normalized.encode("utf-8")).hexdigest(),
+                hashlib.sha256(data_input.encode("utf-8")).hexdigest(),
+            ]
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result, marked with when it was judged"""
+        entry = self.store.get(key)
+        if not entry or time.time() - entry["stored_at"] > RESULT_CACHE_TTL:
+            return None
+        return dict(entry["result"], cached_at=entry["stored_at"])
+
+    def set(self, key: str, result: Dict[str, Any]):
+        if result.get("state") != "SUCCESS":
+            return
+        if result.get("status_code") not in CACHEABLE_STATUS_CODES:
+            return
+        self.store.set(key, {"stored_at": time.time(), "result": result})
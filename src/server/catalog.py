@@ -0,0 +1,244 @@
+import codecs
+import json
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import requests
+import typer
+
+from .config import (
+    APP_NAME,
+    CATALOG_REFRESH_INTERVAL,
+    CATALOG_REFRESH_LOCK_TIMEOUT,
+    LEETCODE_BASE_URL,
+)
+from .timings import span
+from .transport import get_session, is_offline
+
+DIFFICULTY_LEVELS = {1: "Easy", 2: "Medium", 3: "Hard"}
+PAIRS_KEY = '"stat_status_pairs"'
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def iter_stat_status_pairs(chunks: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    """Yield `stat_status_pairs` entries while the payload is still arriving
+
+    Only the current chunk and one partially received entry are held in
+    memory, and the caller may stop iterating as soon as it has a match.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    in_array = False
+
+    for chunk in chunks:
+        buffer += text_decoder.decode(chunk)
+
+        if not in_array:
+            key_at = buffer.find(PAIRS_KEY)
+            if key_at == -1:
+                buffer = buffer[-len(PAIRS_KEY) :]
+                continue
+            array_at = buffer.find("[", key_at)
+            if array_at == -1:
+                buffer = buffer[key_at:]
+                continue
+            buffer = buffer[array_at + 1 :]
+            in_array = True
+
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer):
+                break
+            if buffer[pos] == "]":
+                return
+            try:
+                pair, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            yield pair
+        buffer = buffer[pos:]
+
+
+def build_index(pairs: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Reduce `stat_status_pairs` entries to the fields the CLI needs"""
+    by_id, by_slug = {}, {}
+    for pair in pairs:
+        stat = pair["stat"]
+        slug = stat["question__title_slug"]
+        frontend_id = str(stat["frontend_question_id"])
+        by_id[frontend_id] = slug
+        by_slug[slug] = {
+            "frontend_id": frontend_id,
+            "question_id": str(stat["question_id"]),
+            "title": stat["question__title"],
+            "difficulty": DIFFICULTY_LEVELS.get(
+                pair.get("difficulty", {}).get("level"), "Unknown"
+            ),
+            "paid_only": pair.get("paid_only", False),
+            "ac_rate": 100
+            * stat.get("total_acs", 0)
+            / (stat.get("total_submitted") or 1),
+        }
+    return {"updated_at": time.time(), "by_id": by_id, "by_slug": by_slug}
+
+
+class ProblemCatalog:
+    """On-disk index of the problem set, keyed by frontend id and by slug.
+
+    The index is built from `/api/problems/all/` once and then only refreshed
+    in a detached background process, so lookups never wait on the network.
+    """
+
+    def __init__(self):
+        self.config_dir = Path(typer.get_app_dir(APP_NAME))
+        self.index_file = self.config_dir / "catalog.json"
+        self.lock_file = self.config_dir / "catalog.lock"
+        self._index: Optional[Dict[str, Any]] = None
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        """Load the index from disk once per instance"""
+        if self._index is None:
+            with span("cache.catalog") as current:
+                try:
+                    with open(self.index_file, "r") as f:
+                        self._index = json.load(f)
+                except Exception:
+                    current.attrs["hit"] = False
+                    return None
+                current.attrs["hit"] = True
+        return self._index
+
+    def _write(self, index: Dict[str, Any]):
+        """Atomically replace the index file"""
+        tmp_file = self.index_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_file, self.index_file)
+
+    @contextmanager
+    def _stream_pairs(
+        self, session: Optional[requests.Session] = None
+    ) -> Iterator[Iterator[Dict[str, Any]]]:
+        """Stream `/api/problems/all/` entries to the body of a `with` block
+
+        The download span and the response last exactly as long as the
+        block, however much of the list it reads.
+        """
+        session = session if session is not None else get_session()
+        url = f"{LEETCODE_BASE_URL}/api/problems/all/"
+        with span("http.download", url=url, bytes=0) as current:
+            with session.get(url, stream=True) as response:
+                response.raise_for_status()
+                yield iter_stat_status_pairs(
+                    self._count_bytes(
+                        response.iter_content(chunk_size=STREAM_CHUNK_SIZE), current
+                    )
+                )
+
+    @staticmethod
+    def _count_bytes(chunks: Iterable[bytes], current) -> Iterator[bytes]:
+        for chunk in chunks:
+            current.attrs["bytes"] += len(chunk)
+            yield chunk
+
+    def build(self, session: Optional[requests.Session] = None) -> Dict[str, Any]:
+        """Download the problem list and rebuild the index"""
+        with self._stream_pairs(session) as pairs:
+            index = build_index(pairs)
+        self._write(index)
+        self._index = index
+        return index
+
+    def scan_for_slug(
+        self, frontend_id: str, session: Optional[requests.Session] = None
+    ) -> Optional[str]:
+        """Find one slug in the live problem list, stopping at the match"""
+        with self._stream_pairs(session) as pairs:
+            for pair in pairs:
+                stat = pair["stat"]
+                if str(stat["frontend_question_id"]) == str(frontend_id):
+                    return stat["question__title_slug"]
+        return None
+
+    def is_stale(self) -> bool:
+        index = self._load()
+        if not index:
+            return True
+        return time.time() - index.get("updated_at", 0) > CATALOG_REFRESH_INTERVAL
+
+    def refresh_in_background(self):
+        """Rebuild the index in a detached process unless one is already running"""
+        if is_offline():
+            return
+        try:
+            if (
+                self.lock_file.exists()
+                and time.time() - self.lock_file.stat().st_mtime
+                < CATALOG_REFRESH_LOCK_TIMEOUT
+            ):
+                return
+            self.lock_file.touch()
+
+            env = dict(os.environ)
+            env.pop("LC_TRACE", None)
+            package_root = str(Path(__file__).resolve().parents[2])
+            env["PYTHONPATH"] = os.pathsep.join(
+                filter(None, [package_root, env.get("PYTHONPATH")])
+            )
+            subprocess.Popen(
+                [sys.executable, "-m", __name__],
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        except Exception:
+            pass
+
+    def ensure(self, session: Optional[requests.Session] = None) -> Dict[str, Any]:
+        """Return the index, building it synchronously only if none exists yet"""
+        index = self._load()
+        if not index:
+            return self.build(session)
+        if self.is_stale():
+            self.refresh_in_background()
+        return index
+
+    def resolve_slug(
+        self, frontend_id: str, session: Optional[requests.Session] = None
+    ) -> Optional[str]:
+        """Map a frontend question number to its title slug
+
+        Without an index yet, the live list is scanned up to the match and
+        the full index is built in the background for later lookups.
+        """
+        if not self._load():
+            title_slug = self.scan_for_slug(frontend_id, session)
+            self.refresh_in_background()
+            return title_slug
+        return self.ensure(session)["by_id"].get(str(frontend_id))
+
+    def get(
+        self, title_slug: str, session: Optional[requests.Session] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return the indexed summary for a title slug"""
+        return self.ensure(session)["by_slug"].get(title_slug)
+
+
+if __name__ == "__main__":
+    catalog = ProblemCatalog()
+    try:
+        catalog.build()
+    finally:
+        if catalog.lock_file.exists():
+            catalog.lock_file.unlink()
@@ -0,0 +1,229 @@
+import html
+import json
+import math
+import random
+import re
+import string
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .config import (
+    COMPLEXITY_MAX_CALL_TIME,
+    COMPLEXITY_MIN_TIME,
+    COMPLEXITY_REPEATS,
+    COMPLEXITY_SIZES,
+    COMPLEXITY_TIME_LIMIT,
+)
+from .local_runner import LocalRunner, UnsupportedError
+from .timings import span
+
+# Candidate growth rates, from the slowest growing up
+MODELS: Dict[str, Callable[[float], float]] = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n²)": lambda n: n**2,
+    "O(n³)": lambda n: n**3,
+    "O(2ⁿ)": lambda n: 2.0 ** min(n, 1000),
+}
+
+_CONSTRAINT = re.compile(
+    r"(\w+)(?:\.length)?\s*<=\s*(\d+\s*\*\s*10\^\d+|10\^\d+|\d[\d,]*)"
+)
+
+
+def _element_type(type_name: str) -> Optional[str]:
+    if type_name.endswith("[]"):
+        return type_name[:-2]
+    if type_name.startswith("list<") and type_name.endswith(">"):
+        return type_name[5:-1]
+    return None
+
+
+def _is_collection(type_name: str) -> bool:
+    return type_name in ("string", "ListNode", "TreeNode") or bool(
+        _element_type(type_name)
+    )
+
+
+def generate_value(type_name: str, n: int, rng: random.Random) -> Any:
+    """A random value of a signature type whose size grows with `n`
+
+    Arrays and lists get `n` elements, strings `n` letters, linked lists
+    and trees `n` nodes; nested arrays are about √n by √n. Numbers span a
+    wide range, so that searches rarely stop early by chance.
+    """
+    if type_name in ("integer", "long"):
+        return rng.randint(-(10**9), 10**9)
+    if type_name == "double":
+        return rng.uniform(-(10**9), 10**9)
+    if type_name == "boolean":
+        return rng.random() < 0.5
+    if type_name == "character":
+        return rng.choice(string.ascii_lowercase)
+    if type_name == "string":
+        return "".join(rng.choices(string.ascii_lowercase, k=n))
+    if type_name in ("ListNode", "TreeNode"):
+        return [rng.randint(-(10**4), 10**4) for _ in range(n)]
+
+    inner = _element_type(type_name)
+    if inner is None:
+        raise UnsupportedError(f"Cannot generate inputs of type {type_name}")
+    if _element_type(inner) is not None:
+        side = max(1, math.isqrt(n))
+        if inner.startswith("character"):
+            return [rng.choices("01", k=side) for _ in range(side)]
+        return [generate_value(inner, side, rng) for _ in range(side)]
+    if inner == "string":
+        return [generate_value("string", 5, rng) for _ in range(n)]
+    return [generate_value(inner, n, rng) for _ in range(n)]
+
+
+def generate_inputs(meta: Dict[str, Any], n: int, rng: random.Random) -> List[str]:
+    """One JSON line per parameter, sized `n`
+
+    When no parameter is a collection, integer parameters are the size
+    themselves (as in `climbStairs(n)`); otherwise they are between 1 and
+    `n`, like a `k` would be.
+    """
+    params = meta["params"]
+    sized_by_value = not any(_is_collection(p["type"]) for p in params)
+    lines = []
+    for param in params:
+        if param["type"] in ("integer", "long"):
+            value: Any = n if sized_by_value else rng.randint(1, n)
+        else:
+            value = generate_value(param["type"], n, rng)
+        lines.append(json.dumps(value))
+    return lines
+
+
+def fit(samples: List[Tuple[int, float]]) -> Tuple[str, float]:
+    """Pick the model whose ratio to the timings varies least
+
+    Returns the model name and the coefficient `c` in `time ≈ c·f(n)`.
+    Ratios are compared on a log scale, so every size counts the same.
+    """
+    best = ("O(1)", 0.0, math.inf)
+    for name, model in MODELS.items():
+        logs = [math.log(t / model(n)) for n, t in samples if t > 0]
+        if not logs:
+            continue
+        mean = sum(logs) / len(logs)
+        spread = sum((x - mean) ** 2 for x in logs) / len(logs)
+        # Prefer the slower-growing model unless another is clearly better
+        if spread < best[2] * 0.8:
+            best = (name, math.exp(mean), spread)
+    return best[0], best[1]
+
+
+def size_at(model: str, coefficient: float, seconds: float) -> Optional[int]:
+    """The input size at which the fitted curve reaches `seconds`"""
+    f = MODELS[model]
+    if coefficient <= 0 or coefficient * f(2**62) < seconds:
+        return None
+    low, high = 1, 2
+    while coefficient * f(high) < seconds:
+        low, high = high, high * 2
+    while high - low > 1:
+        middle = (low + high) // 2
+        if coefficient * f(middle) < seconds:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+def _parse_bound(text: str) -> int:
+    text = text.replace(",", "").replace(" ", "")
+    if "^" in text:
+        base, _, exponent = text.rpartition("10^")
+        factor = int(base.rstrip("*")) if base else 1
+        return factor * 10 ** int(exponent)
+    return int(text)
+
+
+def parse_size_limit(content: Optional[str], meta: Dict[str, Any]) -> Optional[int]:
+    """The largest input size the problem's constraints allow, if stated"""
+    text = re.sub(r"<sup>(\d+)</sup>", r"^\1", content or "")
+    text = html.unescape(re.sub(r"<[^>]+>", "", text))
+    params = meta["params"]
+    sized_by_value = not any(_is_collection(p["type"]) for p in params)
+    names = {
+        param["name"]
+        for param in params
+        if _is_collection(param["type"]) or sized_by_value
+    } | {"n"}
+
+    bounds = [
+        _parse_bound(bound)
+        for name, bound in _CONSTRAINT.findall(text)
+        if name in names
+    ]
+    return max(bounds) if bounds else None
+
+
+def profile(
+    question: Dict[str, Any],
+    code: str,
+    lang: str,
+    sizes: List[int] = COMPLEXITY_SIZES,
+    repeats: int = COMPLEXITY_REPEATS,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Time a solution on random inputs of growing size and fit its growth
+
+    Sizes are tried in order, each `repeats` times on different inputs in
+    parallel, keeping the fastest run. Profiling stops early once a call
+    takes longer than COMPLEXITY_MAX_CALL_TIME, fails or times out.
+    """
+    runner = LocalRunner(question, code, lang)
+    rng = random.Random(seed)
+    samples: List[Tuple[int, float]] = []
+    stopped = None
+
+    for n in sizes:
+        inputs = [generate_inputs(runner.meta, n, rng) for _ in range(repeats)]
+        with span("complexity.size", n=n):
+            results = runner.run(inputs)
+
+        failed = next((r for r in results if "elapsed" not in r), None)
+        if failed is not None:
+            stopped = (
+                f"timed out at n={n}"
+                if failed.get("timeout")
+                else f"failed at n={n}: {failed.get('error', '').splitlines()[-1]}"
+            )
+            break
+
+        elapsed = min(r["elapsed"] for r in results)
+        samples.append((n, elapsed))
+        if elapsed > COMPLEXITY_MAX_CALL_TIME:
+            stopped = f"stopped at n={n}, a call took over {COMPLEXITY_MAX_CALL_TIME}s"
+            break
+
+    report: Dict[str, Any] = {
+        "samples": samples,
+        "stopped": stopped,
+        "complexity": None,
+        "limit_size": None,
+        "max_size": parse_size_limit(question.get("content"), runner.meta),
+        "predicted": None,
+        "time_limit": COMPLEXITY_TIME_LIMIT,
+    }
+    if len(samples) < 3:
+        return report
+
+    # Tiny timings mostly measure call overhead and would flatten the curve
+    measured = [(n, t) for n, t in samples if t >= COMPLEXITY_MIN_TIME]
+    if len(measured) >= 3:
+        model, coefficient = fit(measured)
+    elif not measured:
+        model, coefficient = "O(1)", max(t for _, t in samples)
+    else:
+        model, coefficient = fit(samples)
+    report["complexity"] = model
+    report["limit_size"] = size_at(model, coefficient, COMPLEXITY_TIME_LIMIT)
+    if report["max_size"]:
+        report["predicted"] = coefficient * MODELS[model](report["max_size"])
+    return report
@@ -1,5 +1,36 @@
-BASE_URL = "https://leetcode.com/graphql"
-LEETCODE_BASE_URL = "https://leetcode.com"
+import os
+import re
+import sys
+from urllib.parse import urlparse
+
+
+def _env_int(name: str, default: int, minimum: int = 0) -> int:
+    """An integer setting from the environment, or `default` if it is invalid"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = minimum - 1
+    if number < minimum:
+        print(
+            f"⚠️  Ignoring {name}={value!r}: expected an integer of at least "
+            f"{minimum}; using {default}",
+            file=sys.stderr,
+        )
+        return default
+    return number
+
+
+DEFAULT_BASE_URL = "https://leetcode.com"
+# Override to point the CLI at another host, such as benchmarks/fake_server.py
+LEETCODE_BASE_URL = os.environ.get("LEETCODE_BASE_URL", DEFAULT_BASE_URL).rstrip("/")
+# Another host keeps its session and caches apart from those of leetcode.com
+APP_NAME = "leetcode-cli"
+if LEETCODE_BASE_URL != DEFAULT_BASE_URL:
+    APP_NAME += "-" + re.sub(r"[^\w.-]", "_", urlparse(LEETCODE_BASE_URL).netloc)
+BASE_URL = f"{LEETCODE_BASE_URL}/graphql"
 STATUS_CODES = {
     10: "Accepted",
     11: "Wrong Answer",
@@ -29,3 +60,47 @@ MEMORY_WARNING_THRESHOLD = 100000000  # 100MB
 MEMORY_LIMIT_THRESHOLD = 450000000  # 450MB
 TEST_RESULT_TIMEOUT = 30
 SUBMISSION_RESULT_TIMEOUT = 20
+CATALOG_REFRESH_INTERVAL = 24 * 60 * 60  # 1 day
+CATALOG_REFRESH_LOCK_TIMEOUT = 10 * 60  # 10 minutes
+SESSION_VALIDATION_TTL = _env_int("LEETCODE_SESSION_TTL", 6 * 60 * 60)  # 6 hours
+QUESTION_CONTENT_TTL = 30 * 24 * 60 * 60  # 30 days
+QUESTION_FIELD_TTLS = {"stats": 60 * 60}  # volatile fields, refreshed hourly
+QUESTION_CACHE_MAX_BYTES = (
+    _env_int("LEETCODE_QUESTION_CACHE_MB", 256, minimum=1) * 1024 * 1024
+)  # room for every problem
+CACHE_EVICT_RATIO = 0.9  # disk caches are trimmed to this share of their budget
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = _env_int("LEETCODE_HTTP_POOL_SIZE", 16, minimum=1)
+POLL_INITIAL_INTERVAL = 0.2  # seconds
+POLL_MAX_INTERVAL = 2.0  # seconds
+POLL_BACKOFF_FACTOR = 1.5
+POLL_WORKERS = 4  # concurrent result checks of the shared poller
+POLL_CANCEL_CHECK_INTERVAL = 0.05  # seconds between checks for a stale poll
+WATCH_POLL_INTERVAL = 0.1  # seconds between file checks in `lc test --watch`
+WATCH_DEBOUNCE = 0.3  # seconds a file must stay unchanged before a re-run
+SYNC_WORKERS = 8
+SYNC_CHECKPOINT_EVERY = 25  # problems
+SUBMIT_BATCH_WORKERS = 3  # concurrent submissions in `lc submit-batch`
+HTTP_CONNECT_TIMEOUT = 3.05  # seconds
+HTTP_READ_TIMEOUT = 30  # seconds
+RESPONSE_CACHE_MAX_BYTES = 20 * 1024 * 1024  # 20MB
+RESULT_CACHE_MAX_BYTES = 10 * 1024 * 1024  # 10MB
+RESULT_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days; judges gain test cases over time
+CACHEABLE_STATUS_CODES = {10, 11, 15, 20}  # verdicts that do not vary per run
+TRACE_FILE = os.environ.get("LC_TRACE")  # Chrome trace-event output path
+SPAN_BUFFER_SIZE = 10000  # most recent spans kept for --timings and traces
+METRICS_ENABLED = os.environ.get("LEETCODE_METRICS", "1") != "0"
+METRICS_MAX_SAMPLES = 200  # latency samples kept per operation
+METRICS_LOCK_TIMEOUT = 2  # seconds a process waits to fold in its metrics
+METRICS_LOCK_STALE = 30  # seconds before a leftover lock file is ignored
+LOCAL_RUN_TIMEOUT = 5  # seconds per test case
+LOCAL_RUN_WORKERS = min(8, os.cpu_count() or 1)
+LOCAL_RUN_ADDRESS_SPACE = 2 * 1024 * 1024 * 1024  # 2GB of virtual memory
+COMPLEXITY_SIZES = [2**k for k in range(4, 18)]  # 16 .. 131072
+COMPLEXITY_REPEATS = 3
+COMPLEXITY_MIN_TIME = 50e-6  # seconds; faster calls are mostly overhead
+COMPLEXITY_MAX_CALL_TIME = 1.0  # seconds; larger sizes are not tried
+COMPLEXITY_TIME_LIMIT = 1.0  # seconds, roughly what one large case may take
+MEMORY_PROFILE_SIZE = 10**5  # input size when the constraints state none
+MEMORY_PROFILE_TIMEOUT = 30  # seconds; tracemalloc slows calls down
+MEMORY_SAMPLE_INTERVAL = 0.01  # seconds between allocation snapshots
@@ -0,0 +1,63 @@
+import os
+import threading
+import time
+from typing import Optional, Tuple
+
+from .config import WATCH_DEBOUNCE, WATCH_POLL_INTERVAL
+
+
+class FileWatcher:
+    """Sets `changed` once a file was modified and then left alone
+
+    A daemon thread polls the file's modification time and size every
+    WATCH_POLL_INTERVAL. Editors often write a file in several steps, so
+    a change only counts after the file has stayed the same for
+    WATCH_DEBOUNCE; a burst of saves gives a single event.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        interval: float = WATCH_POLL_INTERVAL,
+        debounce: float = WATCH_DEBOUNCE,
+    ):
+        self.path = path
+        self.interval = interval
+        self.debounce = debounce
+        self.changed = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            # Editors that save by renaming briefly leave no file behind
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="leetcode-watch", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        seen = self._signature()
+        modified_at: Optional[float] = None
+        while not self._stopped.wait(self.interval):
+            current = self._signature()
+            if current != seen:
+                seen, modified_at = current, time.monotonic()
+            elif (
+                modified_at is not None
+                and current is not None
+                and time.monotonic() - modified_at >= self.debounce
+            ):
+                modified_at = None
+                self.changed.set()
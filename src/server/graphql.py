@@ -0,0 +1,97 @@
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from .config import BASE_URL
+from .timings import span
+from .transport import get_csrf_token, get_session
+
+_OPERATION_NAME = re.compile(r"^\s*(?:query|mutation)\s+(\w+)")
+
+# Operation name -> request body up to the variables, already JSON-encoded
+_documents: Dict[str, bytes] = {}
+# Operation name -> minified query, to catch two documents sharing a name
+_queries: Dict[str, str] = {}
+
+
+class GraphQLError(Exception):
+    """The server answered with GraphQL errors, possibly next to partial data"""
+
+    def __init__(self, errors: List[Dict[str, Any]], data: Optional[dict] = None):
+        self.errors = errors
+        self.data = data
+        super().__init__(errors[0].get("message", "Unknown error"))
+
+
+def register(document: str) -> str:
+    """Register a named query document once and return its operation name
+
+    The document is minified and serialized into the request body prefix
+    here, so each call only has to encode its variables. Registering a
+    different document under a name already taken raises ValueError.
+    """
+    match = _OPERATION_NAME.match(document)
+    if not match:
+        raise ValueError("GraphQL documents must be named operations")
+
+    operation = match.group(1)
+    query = " ".join(document.split())
+    if operation in _queries:
+        if _queries[operation] != query:
+            raise ValueError(
+                f"GraphQL operation {operation} is already registered "
+                "with a different document"
+            )
+    else:
+        _queries[operation] = query
+        _documents[operation] = (
+            '{"operationName": %s, "query": %s, "variables": '
+            % (json.dumps(operation), json.dumps(query))
+        ).encode("utf-8")
+    return operation
+
+
+def encode(operation: str, variables: Optional[Dict[str, Any]] = None) -> bytes:
+    """Build the request body of a registered operation"""
+    return _documents[operation] + json.dumps(variables or {}).encode("utf-8") + b"}"
+
+
+def post(
+    operation: str,
+    variables: Optional[Dict[str, Any]] = None,
+    session: Optional[requests.Session] = None,
+) -> Dict[str, Any]:
+    """Post a registered operation and return the whole response body"""
+    session = session if session is not None else get_session()
+    with span("graphql", operation=operation):
+        response = session.post(
+            BASE_URL,
+            data=encode(operation, variables),
+            headers={
+                "Content-Type": "application/json",
+                "x-csrftoken": get_csrf_token(session),
+            },
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Request failed with status {response.status_code}")
+
+        return response.json()
+
+
+def execute(
+    operation: str,
+    variables: Optional[Dict[str, Any]] = None,
+    session: Optional[requests.Session] = None,
+) -> Dict[str, Any]:
+    """Post a registered operation and return its `data`
+
+    Raises GraphQLError, carrying any partial data, when the response
+    reports errors.
+    """
+    result = post(operation, variables, session)
+    if result.get("errors"):
+        raise GraphQLError(result["errors"], result.get("data"))
+    return result.get("data") or {}
@@ -0,0 +1,258 @@
+import io
+import json
+import linecache
+import sys
+import threading
+import time
+import traceback
+
+# Run as a script in a child interpreter by local_runner: reads one request
+# as JSON on stdin, calls the solution once and prints one JSON line back.
+# It must not import anything from the CLI.
+
+# What LeetCode's Python judge makes available without imports
+PRELUDE = """
+from typing import *
+from collections import *
+from heapq import *
+from bisect import *
+from functools import *
+from itertools import *
+from math import *
+import collections, heapq, bisect, functools, itertools, math, operator, random, re, string
+"""
+
+
+class ListNode:
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+
+class TreeNode:
+    def __init__(self, val=0, left=None, right=None):
+        self.val = val
+        self.left = left
+        self.right = right
+
+
+def to_linked_list(values):
+    head = current = ListNode()
+    for value in values:
+        current.next = ListNode(value)
+        current = current.next
+    return head.next
+
+
+def from_linked_list(node):
+    values = []
+    while node is not None and len(values) <= 100000:
+        values.append(node.val)
+        node = node.next
+    return values
+
+
+def to_tree(values):
+    """Build a tree from LeetCode's level-order list with nulls"""
+    if not values or values[0] is None:
+        return None
+    root = TreeNode(values[0])
+    queue = [root]
+    index = 1
+    for node in queue:
+        if index >= len(values):
+            break
+        if values[index] is not None:
+            node.left = TreeNode(values[index])
+            queue.append(node.left)
+        index += 1
+        if index < len(values) and values[index] is not None:
+            node.right = TreeNode(values[index])
+            queue.append(node.right)
+        index += 1
+    return root
+
+
+def from_tree(root):
+    values = []
+    queue = [root]
+    for node in queue:
+        values.append(node.val if node is not None else None)
+        if node is not None:
+            queue.extend((node.left, node.right))
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+
+def element_type(type_name):
+    if type_name.endswith("[]"):
+        return type_name[:-2]
+    if type_name.startswith("list<") and type_name.endswith(">"):
+        return type_name[5:-1]
+    return None
+
+
+def convert(value, type_name):
+    """Turn a JSON test case value into the argument type of the signature"""
+    if value is None:
+        return None
+    if type_name == "ListNode":
+        return to_linked_list(value)
+    if type_name == "TreeNode":
+        return to_tree(value)
+    if type_name == "double":
+        return float(value)
+    inner = element_type(type_name)
+    if inner is not None:
+        return [convert(item, inner) for item in value]
+    return value
+
+
+def serialize(value, type_name):
+    if value is None:
+        return None
+    if type_name == "ListNode" or isinstance(value, ListNode):
+        return from_linked_list(value)
+    if type_name == "TreeNode" or isinstance(value, TreeNode):
+        return from_tree(value)
+    inner = element_type(type_name)
+    if inner is not None and isinstance(value, (list, tuple)):
+        return [serialize(item, inner) for item in value]
+    return value
+
+
+def json_default(value):
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return repr(value)
+
+
+def trace_memory(call, solution, interval):
+    """Call with tracemalloc on; return the result and the memory profile
+
+    A sampler thread snapshots the traced allocations whenever they grow
+    past the largest seen so far, so the reported allocation sites are
+    those alive close to the peak rather than after the call returned.
+    """
+    import tracemalloc
+
+    tracemalloc.start()
+    largest = {"size": 0, "snapshot": None}
+    done = threading.Event()
+
+    def sample():
+        wait = interval
+        while not done.wait(wait):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > largest["size"] * 2:
+                started = time.perf_counter()
+                largest["size"] = current
+                largest["snapshot"] = tracemalloc.take_snapshot()
+                # Snapshots grow with the live allocations; keep them rare
+                wait = max(interval, 4 * (time.perf_counter() - started))
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        result = call()
+    finally:
+        done.set()
+        sampler.join()
+        current, peak = tracemalloc.get_traced_memory()
+        if current >= largest["size"]:
+            largest["snapshot"] = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    snapshot = largest["snapshot"].filter_traces([tracemalloc.Filter(True, solution)])
+    top = [
+        {
+            "line": stat.traceback[0].lineno,
+            "code": linecache.getline(solution, stat.traceback[0].lineno).strip(),
+            "size": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:5]
+    ]
+    return result, {"peak": peak, "top": top}
+
+
+def peak_rss():
+    """Peak resident set size of this process in bytes, when known"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def apply_limits(request):
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return
+    cpu = int(request["timeout"]) + 1
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu))
+    if request.get("address_space"):
+        limit = request["address_space"]
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    resource.setrlimit(resource.RLIMIT_FSIZE, (1 << 20, 1 << 20))
+
+
+def main():
+    request = json.load(sys.stdin)
+    meta = request["meta"]
+    params = meta["params"]
+    apply_limits(request)
+
+    namespace = {"ListNode": ListNode, "TreeNode": TreeNode, "__name__": "__main__"}
+    exec(PRELUDE, namespace)
+    captured = io.StringIO()
+    real_stdout, sys.stdout = sys.stdout, captured
+    response = {}
+    try:
+        args = [
+            convert(json.loads(line), param["type"])
+            for line, param in zip(request["args"], params)
+        ]
+        with open(request["solution"], "r") as f:
+            exec(compile(f.read(), request["solution"], "exec"), namespace)
+        method = getattr(namespace["Solution"](), meta["name"])
+
+        started = time.perf_counter()
+        if request.get("memory"):
+            result, response["memory"] = trace_memory(
+                lambda: method(*args), request["solution"], request["sample_interval"]
+            )
+        else:
+            result = method(*args)
+        response["elapsed"] = time.perf_counter() - started
+
+        return_type = meta.get("return", {}).get("type", "void")
+        if return_type == "void":
+            # In-place problems are judged on the argument they modify
+            index = meta.get("output", {}).get("paramindex", 0)
+            result, return_type = args[index], params[index]["type"]
+        response["output"] = serialize(result, return_type)
+    except RecursionError:
+        response["error"] = "RecursionError: maximum recursion depth exceeded"
+    except MemoryError:
+        response["error"] = "MemoryError"
+    except Exception as e:
+        frames = traceback.extract_tb(e.__traceback__)
+        frames = [frame for frame in frames if frame.filename == request["solution"]]
+        response["error"] = "".join(
+            traceback.format_list(frames) + traceback.format_exception_only(type(e), e)
+        ).rstrip()
+    finally:
+        sys.stdout = real_stdout
+
+    response["stdout"] = captured.getvalue()
+    response["peak_rss"] = peak_rss()
+    print(json.dumps(response, default=json_default))
+
+
+if __name__ == "__main__":
+    sys.setrecursionlimit(100000)
+    main()
@@ -0,0 +1,207 @@
+import html
+import json
+import math
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .config import (
+    LOCAL_RUN_ADDRESS_SPACE,
+    LOCAL_RUN_TIMEOUT,
+    LOCAL_RUN_WORKERS,
+    MEMORY_SAMPLE_INTERVAL,
+)
+from .timings import span
+
+DRIVER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "local_driver.py")
+LOCAL_LANGUAGES = {"python3", "python"}
+# A differing output may still be right when any order of the answer is accepted
+FAILED_STATUSES = {"error", "timeout"}
+
+_TAG = re.compile(r"<[^>]+>")
+_OUTPUT = re.compile(r"^\s*Output\s*:?\s*(.*?)\s*$", re.M)
+
+
+class UnsupportedError(Exception):
+    """The problem or language cannot be run locally"""
+
+
+def parse_signature(question: Dict[str, Any]) -> Dict[str, Any]:
+    """The function signature from a question's `metaData`"""
+    try:
+        meta = json.loads(question.get("metaData") or "")
+    except ValueError:
+        raise UnsupportedError("The problem has no function signature")
+
+    if "classname" in meta or meta.get("systemdesign"):
+        raise UnsupportedError("Design problems cannot be run locally yet")
+    if meta.get("manual") or "name" not in meta or "params" not in meta:
+        raise UnsupportedError("The problem has no function signature")
+    return meta
+
+
+def parse_expected_outputs(content: Optional[str]) -> List[str]:
+    """The `Output:` value of each example in a question's HTML description"""
+    text = html.unescape(_TAG.sub("", content or ""))
+    return _OUTPUT.findall(text)
+
+
+def outputs_match(output: Any, expected: Any) -> bool:
+    """Compare like the judge does, with a tolerance for floating point"""
+    if isinstance(output, list) and isinstance(expected, list):
+        return len(output) == len(expected) and all(
+            outputs_match(a, b) for a, b in zip(output, expected)
+        )
+    numbers = (int, float)
+    if (
+        isinstance(output, numbers)
+        and isinstance(expected, numbers)
+        and not isinstance(output, bool)
+        and not isinstance(expected, bool)
+    ):
+        return math.isclose(output, expected, rel_tol=1e-5, abs_tol=1e-5)
+    return output == expected
+
+
+def compact(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"))
+
+
+class LocalRunner:
+    """Runs a solution on given inputs in throwaway child interpreters
+
+    Every input gets its own isolated interpreter (`python -I`) in a
+    temporary directory, with CPU time, address space and file size
+    limits, so a crash or an infinite loop only fails its own case.
+    Cases run `workers` at a time.
+    """
+
+    def __init__(
+        self,
+        question: Dict[str, Any],
+        code: str,
+        lang: str,
+        timeout: float = LOCAL_RUN_TIMEOUT,
+        workers: int = LOCAL_RUN_WORKERS,
+    ):
+        if lang not in LOCAL_LANGUAGES:
+            raise UnsupportedError(f"Local runs support Python only, not {lang}")
+        self.meta = parse_signature(question)
+        self.code = code
+        self.timeout = timeout
+        self.workers = workers
+
+    def run(
+        self, inputs: List[List[str]], memory: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Run each input, given as one JSON value per parameter
+
+        Each result has the `output` (or the `error`), the solution's
+        `stdout`, how long the call itself took in `elapsed` and the peak
+        RSS of its process. With `memory`, calls run under tracemalloc and
+        `memory` holds their peak allocation and top allocation sites.
+        """
+        with tempfile.TemporaryDirectory(prefix="lc-run-") as workdir:
+            with open(os.path.join(workdir, "solution.py"), "w") as f:
+                f.write(self.code)
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                return list(
+                    executor.map(
+                        lambda args: self._run_one(args, workdir, memory), inputs
+                    )
+                )
+
+    def _run_one(self, args: List[str], workdir: str, memory: bool) -> Dict[str, Any]:
+        request = {
+            "meta": self.meta,
+            "args": args,
+            "solution": "solution.py",
+            "timeout": self.timeout,
+            "address_space": LOCAL_RUN_ADDRESS_SPACE,
+            "memory": memory,
+            "sample_interval": MEMORY_SAMPLE_INTERVAL,
+        }
+        started = time.perf_counter()
+        with span("local.case"):
+            try:
+                completed = subprocess.run(
+                    [sys.executable, "-I", DRIVER],
+                    input=json.dumps(request).encode("utf-8"),
+                    capture_output=True,
+                    cwd=workdir,
+                    timeout=self.timeout,
+                )
+            except subprocess.TimeoutExpired:
+                return {"timeout": True, "wall": time.perf_counter() - started}
+
+        wall = time.perf_counter() - started
+        lines = completed.stdout.decode("utf-8", "replace").strip().splitlines()
+        try:
+            result = json.loads(lines[-1])
+        except (IndexError, ValueError):
+            stderr = completed.stderr.decode("utf-8", "replace").strip()
+            if completed.returncode < 0:
+                # Killed by a signal, most likely a resource limit
+                stderr = stderr or f"Process killed by signal {-completed.returncode}"
+            result = {"error": stderr or f"Exited with code {completed.returncode}"}
+        result["wall"] = wall
+        return result
+
+
+def run_examples(
+    question: Dict[str, Any], code: str, lang: str
+) -> List[Dict[str, Any]]:
+    """Run a solution on the question's examples and check it against them
+
+    Each case gets a `status`: passed, failed (the output differs from the
+    example's), error, timeout, or unchecked when the description has no
+    expected output for it.
+    """
+    runner = LocalRunner(question, code, lang)
+    param_count = len(runner.meta["params"])
+    test_cases = question.get("exampleTestcaseList") or []
+    expected_outputs = parse_expected_outputs(question.get("content"))
+
+    inputs = []
+    for test_case in test_cases:
+        lines = test_case.split("\n")
+        if len(lines) != param_count:
+            raise UnsupportedError("The example test cases do not match the signature")
+        inputs.append(lines)
+
+    with span("local.examples", cases=len(inputs)):
+        results = runner.run(inputs)
+
+    cases = []
+    for index, (lines, result) in enumerate(zip(inputs, results)):
+        case = {
+            "input": lines,
+            "expected": None,
+            "output": None,
+            "stdout": result.get("stdout", ""),
+            "error": result.get("error"),
+            "elapsed": result.get("elapsed"),
+        }
+        if index < len(expected_outputs):
+            case["expected"] = expected_outputs[index]
+
+        if result.get("timeout"):
+            case["status"] = "timeout"
+        elif case["error"]:
+            case["status"] = "error"
+        else:
+            case["output"] = compact(result.get("output"))
+            try:
+                expected = json.loads(case["expected"])
+            except (TypeError, ValueError):
+                case["status"] = "unchecked"
+            else:
+                matched = outputs_match(result.get("output"), expected)
+                case["status"] = "passed" if matched else "failed"
+        cases.append(case)
+    return cases
@@ -0,0 +1,41 @@
+import random
+from typing import Any, Dict
+
+from .complexity import generate_inputs, parse_size_limit
+from .config import (
+    MEMORY_LIMIT_THRESHOLD,
+    MEMORY_PROFILE_SIZE,
+    MEMORY_PROFILE_TIMEOUT,
+    MEMORY_WARNING_THRESHOLD,
+)
+from .local_runner import LocalRunner
+from .timings import span
+
+
+def profile_memory(question: Dict[str, Any], code: str, lang: str) -> Dict[str, Any]:
+    """Run a solution once under tracemalloc on a large generated input
+
+    The input is as large as the problem's constraints allow, or
+    MEMORY_PROFILE_SIZE when they state no bound. The report holds the
+    peak of the solution's own allocations, its top allocation sites near
+    that peak and the child's peak RSS, next to the warning and limit
+    thresholds used for LeetCode's reported memory.
+    """
+    runner = LocalRunner(question, code, lang, timeout=MEMORY_PROFILE_TIMEOUT)
+    size = parse_size_limit(question.get("content"), runner.meta)
+    size = min(size or MEMORY_PROFILE_SIZE, MEMORY_PROFILE_SIZE)
+
+    inputs = generate_inputs(runner.meta, size, random.Random(0))
+    with span("memory.profile", n=size):
+        result = runner.run([inputs], memory=True)[0]
+
+    memory = result.get("memory") or {}
+    return {
+        "size": size,
+        "error": "timed out" if result.get("timeout") else result.get("error"),
+        "peak": memory.get("peak"),
+        "top": memory.get("top", []),
+        "peak_rss": result.get("peak_rss"),
+        "warning_threshold": MEMORY_WARNING_THRESHOLD,
+        "limit_threshold": MEMORY_LIMIT_THRESHOLD,
+    }
@@ -0,0 +1,200 @@
+import atexit
+import json
+import os
+import re
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlparse
+
+import typer
+
+from .config import (
+    APP_NAME,
+    METRICS_ENABLED,
+    METRICS_LOCK_STALE,
+    METRICS_LOCK_TIMEOUT,
+    METRICS_MAX_SAMPLES,
+)
+from .timings import Span, add_listener
+
+# Collapse per-problem and per-submission paths into one endpoint each
+_ENDPOINT_PATTERNS = [
+    (re.compile(r"^/problems/[^/]+/"), "/problems/<slug>/"),
+    (re.compile(r"^/submissions/detail/[^/]+/"), "/submissions/detail/<id>/"),
+]
+
+_lock = threading.Lock()
+_current: Optional[Dict[str, Any]] = None  # this process's metrics so far
+
+
+def metrics_file() -> Path:
+    return Path(typer.get_app_dir(APP_NAME)) / "metrics.json"
+
+
+def endpoint(method: str, url: str) -> str:
+    """Name a request by its method and path, with ids replaced by placeholders"""
+    path = urlparse(url).path or "/"
+    for pattern, placeholder in _ENDPOINT_PATTERNS:
+        path = pattern.sub(placeholder, path)
+    return f"{method.upper()} {path}"
+
+
+def empty() -> Dict[str, Any]:
+    return {
+        "since": time.time(),
+        "invocations": 0,
+        "endpoints": {},
+        "caches": {},
+        "latency": {},
+    }
+
+
+def load() -> Dict[str, Any]:
+    """Read the accumulated metrics, or empty ones when there are none yet"""
+    try:
+        with open(metrics_file(), "r") as f:
+            return json.load(f)
+    except Exception:
+        return empty()
+
+
+def reset():
+    path = metrics_file()
+    if path.exists():
+        path.unlink()
+
+
+def merge(data: Dict[str, Any], spans: Iterable[Span]) -> bool:
+    """Add this process's spans to `data`; False when none of them count"""
+    recorded = False
+    for current in spans:
+        attrs = current.attrs
+        if current.name in ("http.request", "http.download"):
+            name = endpoint(attrs.get("method", "GET"), attrs["url"])
+            counts = data["endpoints"].setdefault(
+                name, {"requests": 0, "bytes": 0, "errors": 0}
+            )
+            if current.name == "http.request":
+                counts["requests"] += 1
+                if attrs.get("error") or attrs.get("status", 200) >= 400:
+                    counts["errors"] += 1
+                else:
+                    _sample(data, name, current.duration)
+            # Streamed bodies may be abandoned early, so their download span
+            # reports what was actually read
+            if not attrs.get("stream"):
+                counts["bytes"] += attrs.get("bytes") or 0
+        elif current.name == "graphql":
+            _sample(data, f"graphql {attrs['operation']}", current.duration)
+        elif current.name in ("cache.get", "cache.catalog"):
+            namespace = attrs.get("namespace", "catalog")
+            counts = data["caches"].setdefault(namespace, {"hits": 0, "misses": 0})
+            counts["hits" if attrs.get("hit") else "misses"] += 1
+        else:
+            continue
+        recorded = True
+    return recorded
+
+
+def _sample(data: Dict[str, Any], operation: str, seconds: float):
+    samples = data["latency"].setdefault(operation, [])
+    samples.append(round(seconds * 1000, 1))
+    del samples[:-METRICS_MAX_SAMPLES]
+
+
+def median(samples: List[float]) -> Optional[float]:
+    return statistics.median(samples) if samples else None
+
+
+def record(current: Span):
+    """Aggregate a finished span into this process's metrics"""
+    global _current
+    with _lock:
+        data = _current if _current is not None else empty()
+        if merge(data, [current]):
+            _current = data
+
+
+def combine(data: Dict[str, Any], other: Dict[str, Any]):
+    """Add the counts and latency samples of `other` to `data`"""
+    for section in ("endpoints", "caches"):
+        for name, counts in other[section].items():
+            totals = data[section].setdefault(name, dict.fromkeys(counts, 0))
+            for key, value in counts.items():
+                totals[key] = totals.get(key, 0) + value
+    for operation, samples in other["latency"].items():
+        kept = data["latency"].setdefault(operation, [])
+        kept.extend(samples)
+        del kept[:-METRICS_MAX_SAMPLES]
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[bool]:
+    """Hold a lock file shared with other processes; yields False on timeout
+
+    The lock is created exclusively, so only one process at a time gets
+    past it. One left behind by a crashed process is taken over once it
+    is older than METRICS_LOCK_STALE.
+    """
+    deadline = time.monotonic() + METRICS_LOCK_TIMEOUT
+    while True:
+        try:
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            try:
+                if time.time() - path.stat().st_mtime > METRICS_LOCK_STALE:
+                    path.unlink()
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                yield False
+                return
+            time.sleep(0.01)
+    try:
+        yield True
+    finally:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def save():
+    """Fold the metrics of this process into the metrics file
+
+    Loading, combining and replacing the file happen under a lock file,
+    so processes exiting together do not drop each other's counts. When
+    the lock cannot be had in time, this process's metrics are dropped
+    rather than delaying its exit.
+    """
+    with _lock:
+        if _current is None:
+            return
+        current = _current
+
+    path = metrics_file()
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with _file_lock(path.with_name(f"{path.name}.lock")) as locked:
+            if not locked:
+                return
+            data = load()
+            combine(data, current)
+            data["invocations"] += 1
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+if METRICS_ENABLED:
+    add_listener(record)
+    atexit.register(save)
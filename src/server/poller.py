@@ -0,0 +1,131 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .config import (
+    POLL_BACKOFF_FACTOR,
+    POLL_INITIAL_INTERVAL,
+    POLL_MAX_INTERVAL,
+    POLL_WORKERS,
+)
+from .transport import OfflineError
+
+# Checks a submission once: (result or None, Retry-After delay or None)
+CheckFunction = Callable[[str, float], Tuple[Optional[Dict[str, Any]], Optional[float]]]
+
+TIMEOUT_RESULT = {"success": False, "error": "Timeout waiting for results"}
+CANCELED_RESULT = {"success": False, "canceled": True, "error": "Result abandoned"}
+
+
+class _Pending:
+    __slots__ = ("submission_id", "check", "deadline", "interval", "future")
+
+    def __init__(self, submission_id: str, check: CheckFunction, deadline: float):
+        self.submission_id = submission_id
+        self.check = check
+        self.deadline = deadline
+        self.interval = POLL_INITIAL_INTERVAL
+        self.future: Future = Future()
+
+
+class Poller:
+    """Polls the pending submission ids of the whole process
+
+    Ids are kept in a heap ordered by when they are next due, so one
+    scheduler thread sleeps until the earliest check instead of each
+    caller running its own sleep loop. Checks go out on a few worker
+    threads over the shared session, back off exponentially from
+    POLL_INITIAL_INTERVAL up to POLL_MAX_INTERVAL (or as Retry-After
+    asks), and resolve the id's future once the judge is done, or with an
+    error result in offline mode. Cancelling the future drops the id at
+    its next turn.
+    """
+
+    def __init__(self, workers: int = POLL_WORKERS):
+        self._heap: List[Tuple[float, int, _Pending]] = []
+        self._order = itertools.count()
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="leetcode-poll"
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, submission_id: str, timeout: float, check: CheckFunction) -> Future:
+        """Start polling an id; the future resolves to its result
+
+        On timeout the future resolves to an error result rather than
+        raising, like the judge's own failures.
+        """
+        pending = _Pending(submission_id, check, time.monotonic() + timeout)
+        self._schedule(pending, time.monotonic())
+        return pending.future
+
+    def pending(self) -> int:
+        with self._condition:
+            return sum(1 for _, _, p in self._heap if not p.future.done())
+
+    def _schedule(self, pending: _Pending, due: float):
+        with self._condition:
+            heapq.heappush(self._heap, (due, next(self._order), pending))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="leetcode-poller", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    timeout = (
+                        self._heap[0][0] - time.monotonic() if self._heap else None
+                    )
+                    self._condition.wait(timeout)
+                _, _, pending = heapq.heappop(self._heap)
+
+            if not pending.future.done():
+                self._executor.submit(self._check, pending)
+
+    def _check(self, pending: _Pending):
+        try:
+            result, retry_after = pending.check(pending.submission_id, pending.deadline)
+        except OfflineError as e:
+            return self._resolve(pending, {"success": False, "error": str(e)})
+        except Exception:
+            result, retry_after = None, None
+
+        if result is not None:
+            return self._resolve(pending, result)
+
+        now = time.monotonic()
+        if now >= pending.deadline:
+            return self._resolve(pending, dict(TIMEOUT_RESULT))
+
+        delay = retry_after if retry_after is not None else pending.interval
+        pending.interval = min(
+            pending.interval * POLL_BACKOFF_FACTOR, POLL_MAX_INTERVAL
+        )
+        self._schedule(pending, min(now + delay, pending.deadline))
+
+    @staticmethod
+    def _resolve(pending: _Pending, result: Dict[str, Any]):
+        # False when the future was cancelled while the check was in flight
+        if pending.future.set_running_or_notify_cancel():
+            pending.future.set_result(result)
+
+
+_poller: Optional[Poller] = None
+_poller_lock = threading.Lock()
+
+
+def get_poller() -> Poller:
+    """Return the process-wide poller"""
+    global _poller
+    with _poller_lock:
+        if _poller is None:
+            _poller = Poller()
+        return _poller
@@ -1,13 +1,17 @@
 import json
+import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 import typer
 
+from .config import APP_NAME, SESSION_VALIDATION_TTL
+
 
 class SessionManager:
-    def __init__(self):
-        self.config_dir = Path(typer.get_app_dir("leetcode-cli"))
+    def __init__(self, validation_ttl: int = SESSION_VALIDATION_TTL):
+        self.validation_ttl = validation_ttl
+        self.config_dir = Path(typer.get_app_dir(APP_NAME))
         self.config_file = self.config_dir / "session.json"
         self._ensure_config_dir()
 
@@ -21,11 +25,12 @@ class SessionManager:
             "csrftoken": csrftoken,
             "session_token": session_token,
             "user_name": user_name,
+            "validated_at": time.time(),
         }
         with open(self.config_file, "w") as f:
             json.dump(data, f)
 
-    def load_session(self) -> Optional[Dict[str, str]]:
+    def load_session(self) -> Optional[Dict[str, Any]]:
         """Load the session token and username from file"""
         try:
             if self.config_file.exists():
@@ -35,6 +40,11 @@ class SessionManager:
             pass
         return None
 
+    def is_validation_fresh(self, session: Dict[str, Any]) -> bool:
+        """Check whether the session was validated within the TTL"""
+        validated_at = session.get("validated_at", 0)
+        return 0 <= time.time() - validated_at < self.validation_ttl
+
     def clear_session(self):
         """Clear the stored session"""
         if self.config_file.exists():
@@ -1,17 +1,140 @@
+import json
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
-
+from collections import Counter
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..server.cache import QuestionCache, ResponseCache, ResultCache
+from ..server.catalog import ProblemCatalog
 from ..server.config import (
     LEETCODE_BASE_URL,
+    POLL_CANCEL_CHECK_INTERVAL,
+    POLL_MAX_INTERVAL,
+    QUESTION_FIELD_TTLS,
     SUBMISSION_RESULT_TIMEOUT,
     TEST_RESULT_TIMEOUT,
 )
+from ..server.graphql import post, register
+from ..server.poller import CANCELED_RESULT, get_poller
+from ..server.timings import span, timed
+from ..server.transport import (
+    OfflineError,
+    get_csrf_token,
+    get_session,
+    is_offline,
+)
+
+QUESTION_DATA_QUERY = register(
+    """
+  query questionData($titleSlug: String!) {
+    question(titleSlug: $titleSlug) {
+      questionId
+      questionFrontendId
+      title
+      titleSlug
+      topicTags {
+        name
+      }
+      similarQuestionList {
+        title
+        titleSlug
+        difficulty
+        isPaidOnly
+      }
+      content
+      difficulty
+      exampleTestcaseList
+      sampleTestCase
+      stats
+      metaData
+      codeSnippets {
+        lang
+        langSlug
+        code
+      }
+    }
+  }
+"""
+)
+
+SOLUTION_ARTICLES_QUERY = register(
+    """
+  query ugcArticleSolutionArticles(
+    $questionSlug: String!,
+    $orderBy: ArticleOrderByEnum,
+    $userInput: String,
+    $tagSlugs: [String!],
+    $skip: Int,
+    $before: String,
+    $after: String,
+    $first: Int,
+    $last: Int,
+    $isMine: Boolean
+  ) {
+    ugcArticleSolutionArticles(
+      questionSlug: $questionSlug
+      orderBy: $orderBy
+      userInput: $userInput
+      tagSlugs: $tagSlugs
+      skip: $skip
+      first: $first
+      before: $before
+      after: $after
+      last: $last
+      isMine: $isMine
+    ) {
+      totalNum
+      edges {
+        node {
+          title
+          slug
+          summary
+          author {
+            realName
+            userSlug
+            userName
+          }
+          articleType
+          summary
+          createdAt
+          updatedAt
+          topicId
+          hitCount
+          reactions {
+            count
+            reactionType
+          }
+          tags {
+            name
+            slug
+            tagType
+          }
+        }
+      }
+    }
+  }
+"""
+)
 
 
 class SolutionManager:
-    def __init__(self, session):
-        self.session = session
+    # Shared by all instances: a command such as `daily` builds several
+    # managers, and each GraphQL document should still be fetched only once.
+    _memo: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    request_counts: Counter = Counter()
+
+    def __init__(self, session=None, memoize: bool = True):
+        self.session = session if session is not None else get_session()
+        self.memoize = memoize
         self.BASE_URL = LEETCODE_BASE_URL
+        self.catalog = ProblemCatalog()
+        self.question_cache = QuestionCache()
+        self.response_cache = ResponseCache()
+        self.result_cache = ResultCache()
+        self._resolved_slugs: Dict[str, str] = {}
         self._clean_session_cookies()
 
     def _clean_session_cookies(self):
@@ -21,6 +144,9 @@ class SolutionManager:
             return
 
         all_cookies = list(self.session.cookies)
+        if len({cookie.name for cookie in all_cookies}) == len(all_cookies):
+            # Nothing to do, and concurrent requests never see an empty jar
+            return
         self.session.cookies.clear()
 
         for cookie in reversed(all_cookies):
@@ -30,23 +156,52 @@ class SolutionManager:
 
     def _get_csrf_token(self):
         """Get CSRF token from cookies"""
-        for cookie in self.session.cookies:
-            if cookie.name == "csrftoken":
-                return cookie.value
-        return ""
-
+        return get_csrf_token(self.session)
+
+    @classmethod
+    def clear_memo(cls):
+        """Forget memoized GraphQL responses and reset request counters"""
+        cls._memo.clear()
+        cls.request_counts.clear()
+
+    def _graphql(self, operation: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """Post a registered operation, reusing the response for repeated calls"""
+        key = (operation, json.dumps(variables, sort_keys=True))
+        if key in self._memo:
+            self.request_counts["memo_hits"] += 1
+            return self._memo[key]
+
+        self.request_counts[operation] += 1
+        result = post(operation, variables, self.session)
+        if self.memoize and not result.get("errors"):
+            self._memo[key] = result
+        return result
+
+    @timed("question.resolve_slug")
     def _resolve_question_slug(self, question_identifier: str) -> str:
         """Convert question number to title slug if needed"""
         if not question_identifier.isdigit():
             return question_identifier
+        if question_identifier in self._resolved_slugs:
+            return self._resolved_slugs[question_identifier]
 
-        response = self.session.get(f"{self.BASE_URL}/api/problems/all/")
-        if response.status_code == 200:
-            problems = response.json().get("stat_status_pairs", [])
-            for problem in problems:
-                if str(problem["stat"]["frontend_question_id"]) == question_identifier:
-                    return problem["stat"]["question__title_slug"]
+        try:
+            title_slug = self.catalog.resolve_slug(question_identifier, self.session)
+        except Exception:
+            title_slug = None
+
+        if title_slug:
+            # Memoized: a lookup may load the index or scan the live list
+            self._resolved_slugs[question_identifier] = title_slug
+            return title_slug
+
+        if is_offline():
+            raise ValueError(
+                f"Question number {question_identifier} is not in the local catalog"
+            )
 
+        # Newly released problems are missing until the next refresh
+        self.catalog.refresh_in_background()
         raise ValueError(f"Question number {question_identifier} not found")
 
     def _prepare_request_headers(
@@ -64,57 +219,66 @@ class SolutionManager:
             "origin": self.BASE_URL,
         }
 
-    def get_question_data(self, question_identifier: str) -> Dict[str, Any]:
+    def _refresh_question_fields(
+        self, title_slug: str, entry: Dict[str, Any], fields: List[str]
+    ) -> Dict[str, Any]:
+        """Re-fetch only the expired scalar fields of a cached question"""
+        fields = sorted(fields)
+        operation = register(
+            f"query questionFields_{'_'.join(fields)}($titleSlug: String!) "
+            f"{{ question(titleSlug: $titleSlug) {{ {' '.join(fields)} }} }}"
+        )
+        result = self._graphql(operation, {"titleSlug": title_slug})
+        question = result.get("data", {}).get("question")
+        if question:
+            self.question_cache.update(title_slug, entry, question)
+        return {"data": {"question": entry["question"]}}
+
+    @timed("question.data")
+    def get_question_data(
+        self, question_identifier: str, refresh: bool = False
+    ) -> Dict[str, Any]:
         """Get question details using GraphQL
         Args:
             question_identifier: Can be either title slug (e.g. 'two-sum') or question number (e.g. '1')
+            refresh: Ignore the local question cache and fetch everything again
         """
         try:
             title_slug = self._resolve_question_slug(question_identifier)
         except ValueError as e:
             return {"error": str(e)}
 
-        query = """
-            query questionData($titleSlug: String!) {
-                question(titleSlug: $titleSlug) {
-                    questionId
-                    questionFrontendId
-                    title
-                    titleSlug
-                    topicTags {
-                        name
-                    }
-                    similarQuestionList {
-                        title
-                        titleSlug
-                        difficulty
-                        isPaidOnly
-                    }
-                    content
-                    difficulty
-                    exampleTestcaseList
-                    sampleTestCase
-                    stats
-                    metaData
-                    codeSnippets {
-                        lang
-                        langSlug
-                        code
-                    }
-                }
-            }
-        """
+        cached = self.question_cache.get(title_slug)
+        if cached and is_offline():
+            return {"data": {"question": cached["question"]}}
+
+        entry = None if refresh else cached
+        if entry:
+            stale_fields = self.question_cache.stale_fields(entry)
+            if not stale_fields:
+                return {"data": {"question": entry["question"]}}
+            if set(stale_fields) <= set(QUESTION_FIELD_TTLS):
+                try:
+                    return self._refresh_question_fields(
+                        title_slug, entry, stale_fields
+                    )
+                except Exception:
+                    return {"data": {"question": entry["question"]}}
 
         try:
-            response = self.session.post(
-                f"{self.BASE_URL}/graphql",
-                json={"query": query, "variables": {"titleSlug": title_slug}},
-            )
-
-            return response.json()
+            result = self._graphql(QUESTION_DATA_QUERY, {"titleSlug": title_slug})
         except Exception as e:
+            if cached:
+                return {"data": {"question": cached["question"]}}
+            if is_offline():
+                return {"error": f"Problem '{title_slug}' is not available offline"}
             return {"error": str(e)}
 
+        question = (result.get("data") or {}).get("question")
+        if question:
+            self.question_cache.set(title_slug, question)
+        return result
+
     def get_problem_solutions(
         self, question_identifier: str, best: bool
     ) -> Dict[str, Any]:
@@ -128,63 +292,6 @@ class SolutionManager:
         except ValueError as e:
             return {"error": str(e)}
 
-        query = """
-            query ugcArticleSolutionArticles(
-                $questionSlug: String!,
-                $orderBy: ArticleOrderByEnum,
-                $userInput: String,
-                $tagSlugs: [String!],
-                $skip: Int,
-                $before: String,
-                $after: String,
-                $first: Int,
-                $last: Int,
-                $isMine: Boolean
-            ) {
-                ugcArticleSolutionArticles(
-                    questionSlug: $questionSlug
-                    orderBy: $orderBy
-                    userInput: $userInput
-                    tagSlugs: $tagSlugs
-                    skip: $skip
-                    first: $first
-                    before: $before
-                    after: $after
-                    last: $last
-                    isMine: $isMine
-                ) {
-                    totalNum
-                    edges {
-                        node {
-                            title
-                            slug
-                            summary
-                            author {
-                                realName
-                                userSlug
-                                userName
-                            }
-                            articleType
-                            summary
-                            createdAt
-                            updatedAt
-                            topicId
-                            hitCount
-                            reactions {
-                                count
-                                reactionType
-                            }
-                            tags {
-                                name
-                                slug
-                                tagType
-                            }
-                        }
-                    }
-                }
-            }
-        """
-
         variables = {
             "questionSlug": title_slug,
             "orderBy": "HOT",
@@ -194,18 +301,11 @@ class SolutionManager:
             "first": 15,
         }
 
-        try:
-            response = self.session.post(
-                f"{self.BASE_URL}/graphql",
-                json={"query": query, "variables": variables},
-            )
-
-            if response.status_code != 200:
-                raise Exception(f"Request failed with status {response.status_code}")
-
-            return response.json()
-        except Exception as e:
-            raise e
+        return self.response_cache.fetch(
+            f"ugcArticleSolutionArticles:{json.dumps(variables, sort_keys=True)}",
+            lambda: self._graphql(SOLUTION_ARTICLES_QUERY, variables),
+            label=f"Solutions for '{title_slug}'",
+        )
 
     def _format_output(self, output: Union[str, List, None]) -> str:
         """Format output that could be string or list"""
@@ -217,27 +317,77 @@ class SolutionManager:
             return output.strip('[]"')
         return str(output)
 
-    def _get_result_with_polling(
-        self, submission_id: str, timeout: int, is_test: bool = False
-    ) -> Dict[str, Any]:
-        """Poll for results with timeout"""
+    def _retry_after(self, response) -> Optional[float]:
+        """Parse a Retry-After header given in seconds or as an HTTP date"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    @timed("judge.poll")
+    def check_result(
+        self, submission_id: str, deadline: float
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[float]]:
+        """Check a submission once
+
+        Returns the finished result, or None together with the delay the
+        server asked for through Retry-After (if any). Raises OfflineError
+        in offline mode.
+        """
         url = f"{self.BASE_URL}/submissions/detail/{submission_id}/check/"
+        try:
+            self.request_counts["check"] += 1
+            response = self.session.get(
+                url, timeout=max(deadline - time.monotonic(), POLL_MAX_INTERVAL)
+            )
 
-        for _ in range(timeout):
-            try:
-                time.sleep(1)
-                response = self.session.get(url)
-
-                if response.status_code != 200:
-                    continue
-
+            if response.status_code == 200:
                 result = response.json()
                 if result.get("state") == "SUCCESS":
-                    return result
-            except Exception:
-                continue
+                    return result, None
+
+            return None, self._retry_after(response)
+        except OfflineError:
+            # The judge's verdict cannot come from the cache; fail right away
+            raise
+        except Exception:
+            return None, None
+
+    def _get_result_with_polling(
+        self,
+        submission_id: str,
+        timeout: int,
+        cancel: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
+        """Wait for results from the shared poller until a wall-clock deadline
+
+        Setting `cancel` abandons the poll within POLL_CANCEL_CHECK_INTERVAL
+        and returns CANCELED_RESULT, as when a newer version of the code
+        makes the result stale.
+        """
+        future = self.watch_result(submission_id, timeout)
+        if cancel is None:
+            return future.result()
+
+        while True:
+            try:
+                return future.result(POLL_CANCEL_CHECK_INTERVAL)
+            except FutureTimeoutError:
+                if cancel.is_set():
+                    future.cancel()
+                    return dict(CANCELED_RESULT)
 
-        return {"success": False, "error": "Timeout waiting for results"}
+    def watch_result(self, submission_id: str, timeout: float) -> Future:
+        """Hand a submission to the shared poller and return its future"""
+        return get_poller().watch(submission_id, timeout, self.check_result)
 
     def _prepare_solution(
         self, title_slug: str, code: str, lang: str
@@ -260,15 +410,50 @@ class SolutionManager:
                 "success": True,
                 "title_slug": title_slug,
                 "question_id": question_data["questionId"],
-                "test_cases": question_data.get("exampleTestcaseList", []),
+                "data_input": self._data_input(
+                    question_data.get("exampleTestcaseList", [])
+                ),
             }
         except Exception as e:
             return {"success": False, "error": f"Error preparing solution: {str(e)}"}
 
-    def submit_solution(
+    def _data_input(self, test_cases: Union[str, List[str]]) -> str:
+        return "\n".join(test_cases) if isinstance(test_cases, list) else test_cases
+
+    def _result_key(
+        self, kind: str, prepared: Dict[str, Any], code: str, lang: str
+    ) -> str:
+        """The result cache key of a prepared or started run
+
+        Test runs, unlike submissions, are keyed by their test input as well.
+        """
+        data_input = "" if kind == "submit" else prepared["data_input"]
+        return ResultCache.key(kind, prepared["title_slug"], lang, code, data_input)
+
+    def cached_result(
+        self, kind: str, title_slug: str, code: str, lang: str
+    ) -> Optional[Dict[str, Any]]:
+        """Look up the verdict of identical code in the result cache"""
+        prep_result = self._prepare_solution(title_slug, code, lang)
+        if not prep_result["success"]:
+            return None
+        return self.result_cache.get(self._result_key(kind, prep_result, code, lang))
+
+    def remember_result(
+        self,
+        kind: str,
+        started: Dict[str, Any],
+        code: str,
+        lang: str,
+        result: Dict[str, Any],
+    ):
+        """Cache the verdict of a run returned by `start_submission` or `start_test`"""
+        self.result_cache.set(self._result_key(kind, started, code, lang), result)
+
+    def start_submission(
         self, title_slug: str, code: str, lang: str = "python3"
     ) -> Dict[str, Any]:
-        """Submit a solution to LeetCode"""
+        """Upload a solution for judging and return its submission id"""
         try:
             prep_result = self._prepare_solution(title_slug, code, lang)
             if not prep_result["success"]:
@@ -282,7 +467,9 @@ class SolutionManager:
 
             data = {"lang": lang, "question_id": question_id, "typed_code": code}
 
-            response = self.session.post(submit_url, json=data, headers=headers)
+            self.request_counts["submit"] += 1
+            with span("submit.post"):
+                response = self.session.post(submit_url, json=data, headers=headers)
 
             if response.status_code != 200:
                 return {
@@ -294,9 +481,12 @@ class SolutionManager:
                 result_data = response.json()
                 submission_id = result_data.get("submission_id")
                 if submission_id:
-                    return self._get_result_with_polling(
-                        submission_id, SUBMISSION_RESULT_TIMEOUT, is_test=False
-                    )
+                    return {
+                        "success": True,
+                        "submission_id": submission_id,
+                        "title_slug": title_slug,
+                        "data_input": prep_result["data_input"],
+                    }
                 else:
                     return {"success": False, "error": "No submission ID received"}
             except ValueError as e:
@@ -308,10 +498,29 @@ class SolutionManager:
         except Exception as e:
             return {"success": False, "error": f"Submission error: {str(e)}"}
 
-    def test_solution(
+    def submit_solution(
+        self, title_slug: str, code: str, lang: str = "python3", use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """Submit a solution to LeetCode, or answer from the result cache"""
+        if use_cache:
+            cached = self.cached_result("submit", title_slug, code, lang)
+            if cached:
+                return cached
+
+        started = self.start_submission(title_slug, code, lang)
+        if not started["success"]:
+            return started
+
+        result = self._get_result_with_polling(
+            started["submission_id"], SUBMISSION_RESULT_TIMEOUT
+        )
+        self.remember_result("submit", started, code, lang, result)
+        return result
+
+    def start_test(
         self, title_slug: str, code: str, lang: str = "python3", full: bool = False
     ) -> Dict[str, Any]:
-        """Test a solution with LeetCode test cases"""
+        """Upload a solution to run against the example test cases"""
         try:
             prep_result = self._prepare_solution(title_slug, code, lang)
             if not prep_result["success"]:
@@ -319,7 +528,6 @@ class SolutionManager:
 
             title_slug = prep_result["title_slug"]
             question_id = prep_result["question_id"]
-            test_cases = prep_result["test_cases"]
 
             endpoint = "submit" if full else "interpret_solution"
             sid_key = "submission_id" if full else "interpret_id"
@@ -330,14 +538,14 @@ class SolutionManager:
                 "lang": lang,
                 "question_id": str(question_id),
                 "typed_code": code,
-                "data_input": "\n".join(test_cases)
-                if isinstance(test_cases, list)
-                else test_cases,
+                "data_input": prep_result["data_input"],
                 "test_mode": False,
                 "judge_type": "small",
             }
 
-            response = self.session.post(url, json=data, headers=headers)
+            self.request_counts[endpoint] += 1
+            with span("test.post"):
+                response = self.session.post(url, json=data, headers=headers)
 
             if response.status_code != 200:
                 return {
@@ -349,9 +557,12 @@ class SolutionManager:
                 result_data = response.json()
                 submission_id = result_data.get(sid_key)
                 if submission_id:
-                    return self._get_result_with_polling(
-                        submission_id, TEST_RESULT_TIMEOUT, is_test=True
-                    )
+                    return {
+                        "success": True,
+                        "submission_id": submission_id,
+                        "title_slug": title_slug,
+                        "data_input": prep_result["data_input"],
+                    }
                 else:
                     return {"success": False, "error": "No submission ID received"}
             except ValueError as e:
@@ -362,3 +573,32 @@ class SolutionManager:
 
         except Exception as e:
             return {"success": False, "error": f"Test error: {str(e)}"}
+
+    def test_solution(
+        self,
+        title_slug: str,
+        code: str,
+        lang: str = "python3",
+        full: bool = False,
+        use_cache: bool = True,
+        cancel: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
+        """Test a solution with LeetCode test cases, or answer from the cache
+
+        Setting `cancel` abandons the wait for the judge's verdict.
+        """
+        kind = "full" if full else "test"
+        if use_cache:
+            cached = self.cached_result(kind, title_slug, code, lang)
+            if cached:
+                return cached
+
+        started = self.start_test(title_slug, code, lang, full)
+        if not started["success"]:
+            return started
+
+        result = self._get_result_with_polling(
+            started["submission_id"], TEST_RESULT_TIMEOUT, cancel=cancel
+        )
+        self.remember_result(kind, started, code, lang, result)
+        return result
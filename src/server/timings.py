@@ -0,0 +1,149 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .config import SPAN_BUFFER_SIZE, TRACE_FILE
+
+_lock = threading.Lock()
+_local = threading.local()
+_spans: Deque["Span"] = deque(maxlen=SPAN_BUFFER_SIZE)
+_keep = bool(TRACE_FILE)
+_listeners: List[Callable[["Span"], None]] = []
+_origin = time.perf_counter()
+
+
+class Span:
+    """One timed phase of a command, in seconds since this module was imported"""
+
+    __slots__ = ("name", "start", "duration", "depth", "thread", "attrs")
+
+    def __init__(self, name: str, start: float, depth: int, attrs: Dict[str, Any]):
+        self.name = name
+        self.start = start
+        self.duration = 0.0
+        self.depth = depth
+        self.thread = threading.get_ident()
+        self.attrs = attrs
+
+    def __repr__(self):
+        return f"Span({self.name!r}, {self.duration * 1000:.1f}ms)"
+
+
+@contextmanager
+def span(name: str, **attrs: Any):
+    """Record how long the body takes as a span called `name`
+
+    Spans opened inside the body on the same thread are nested under it.
+    Extra keyword arguments are stored on the span and may be updated
+    through the yielded object.
+    """
+    depth = getattr(_local, "depth", 0)
+    current = Span(name, time.perf_counter() - _origin, depth, attrs)
+    _local.depth = depth + 1
+    try:
+        yield current
+    finally:
+        _local.depth = depth
+        current.duration = time.perf_counter() - _origin - current.start
+        if _keep:
+            with _lock:
+                _spans.append(current)
+        for listener in _listeners:
+            listener(current)
+
+
+def keep_spans():
+    """Keep finished spans for `get_spans`, as --timings and traces need"""
+    global _keep
+    _keep = True
+
+
+def add_listener(listener: Callable[[Span], None]):
+    """Call `listener` with every span as it finishes, on its thread"""
+    _listeners.append(listener)
+
+
+def timed(name: str):
+    """Decorator form of `span`"""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def get_spans() -> List[Span]:
+    """Finished spans, ordered by start time
+
+    Empty unless `keep_spans` was called; only the most recent
+    SPAN_BUFFER_SIZE spans are kept, so long-running commands stay bounded.
+    """
+    with _lock:
+        return sorted(_spans, key=lambda s: s.start)
+
+
+def clear():
+    with _lock:
+        _spans.clear()
+
+
+def elapsed() -> float:
+    """Seconds since this module was imported"""
+    return time.perf_counter() - _origin
+
+
+def summary(spans: Optional[List[Span]] = None) -> List[Dict[str, Any]]:
+    """Aggregate spans by name in order of first appearance
+
+    Each row has `name`, `depth`, `calls`, `total` and `max`, in seconds.
+    """
+    rows: Dict[str, Dict[str, Any]] = {}
+    for s in spans if spans is not None else get_spans():
+        row = rows.setdefault(
+            s.name,
+            {"name": s.name, "depth": s.depth, "calls": 0, "total": 0.0, "max": 0.0},
+        )
+        row["calls"] += 1
+        row["total"] += s.duration
+        row["max"] = max(row["max"], s.duration)
+    return list(rows.values())
+
+
+def write_chrome_trace(path: str, spans: Optional[List[Span]] = None):
+    """Write spans as a Chrome trace-event file
+
+    Open it in chrome://tracing or https://ui.perfetto.dev; each span is a
+    complete ("X") event on the thread that recorded it, categorized by the
+    prefix of its name.
+    """
+    pid = os.getpid()
+    events = [
+        {
+            "name": s.name,
+            "cat": s.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": round(s.start * 1e6, 1),
+            "dur": round(s.duration * 1e6, 1),
+            "pid": pid,
+            "tid": s.thread,
+            "args": s.attrs,
+        }
+        for s in (spans if spans is not None else get_spans())
+    ]
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+
+
+if TRACE_FILE:
+    atexit.register(write_chrome_trace, TRACE_FILE)
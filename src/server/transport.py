@@ -0,0 +1,137 @@
+import os
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+import typer
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+from . import metrics  # noqa: F401  # persists request and cache counts at exit
+from .config import (
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_READ_TIMEOUT,
+    LEETCODE_BASE_URL,
+)
+from .session_manager import SessionManager
+from .timings import span
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Referer": LEETCODE_BASE_URL,
+}
+
+# http.cookiejar matches dotless hosts such as `localhost` as `localhost.local`
+COOKIE_DOMAIN = urlparse(LEETCODE_BASE_URL).hostname or ""
+if "." not in COOKIE_DOMAIN:
+    COOKIE_DOMAIN += ".local"
+
+_session: Optional[requests.Session] = None
+_offline = os.environ.get("LEETCODE_OFFLINE") == "1"
+_connected = False  # whether any request of this process got a response
+
+
+class OfflineError(requests.ConnectionError):
+    """Raised instead of sending a request while in offline mode"""
+
+
+def is_offline() -> bool:
+    return _offline
+
+
+def set_offline(offline: bool = True, reason: Optional[str] = None):
+    """Switch offline mode; `reason` is shown when the switch is automatic"""
+    global _offline
+    if offline and not _offline and reason:
+        typer.secho(
+            f"⚠️  Network unreachable ({reason}); answering from the local cache",
+            fg=typer.colors.YELLOW,
+            err=True,
+        )
+    _offline = offline
+
+
+def _is_connect_failure(error: requests.ConnectionError) -> bool:
+    """Whether no connection could be opened at all, rather than a dropped one"""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    # Covers refused connections and failed DNS lookups
+    return isinstance(reason, NewConnectionError)
+
+
+class LeetCodeSession(requests.Session):
+    """Session with default timeouts that falls back to offline mode
+
+    When the very first connection of the process cannot be opened, every
+    later request fails immediately instead of waiting on another connect
+    timeout. Once a response came back, network errors are only raised, so
+    a blip does not cut a long-running command off for good.
+    """
+
+    def request(self, method, url, *args, **kwargs):
+        global _connected
+        if _offline:
+            raise OfflineError(f"Offline mode: {method} {url} was not sent")
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+
+        stream = bool(kwargs.get("stream"))
+        with span("http.request", method=method, url=url, stream=stream) as current:
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except requests.ConnectionError as e:
+                current.attrs["error"] = type(e).__name__
+                if not _connected and _is_connect_failure(e):
+                    set_offline(reason=type(e).__name__)
+                raise
+
+            _connected = True
+            current.attrs["status"] = response.status_code
+            length = response.headers.get("Content-Length")
+            if length is None and not stream:
+                length = len(response.content)
+            current.attrs["bytes"] = int(length) if length is not None else None
+            return response
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide HTTP session.
+
+    Every module in `src/server` goes through this factory so connections,
+    TLS handshakes, cookies and default headers are shared by all requests.
+    """
+    global _session
+    if _session is None:
+        session = LeetCodeSession()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(DEFAULT_HEADERS)
+
+        saved_session = SessionManager().load_session()
+        if saved_session:
+            set_auth_cookies(
+                session, saved_session["csrftoken"], saved_session["session_token"]
+            )
+
+        _session = session
+    return _session
+
+
+def set_auth_cookies(session: requests.Session, csrf_token: str, leetcode_session: str):
+    """Attach the LeetCode auth cookies to a session"""
+    session.cookies.set("csrftoken", csrf_token, domain=COOKIE_DOMAIN)
+    session.cookies.set("LEETCODE_SESSION", leetcode_session, domain=COOKIE_DOMAIN)
+
+
+def get_csrf_token(session: requests.Session) -> str:
+    """Get the CSRF token from the session cookies"""
+    for cookie in session.cookies:
+        if cookie.name == "csrftoken":
+            return cookie.value
+    return ""
@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+from src.server.cache import DiskCache
+from src.server.config import CACHE_EVICT_RATIO
+
+
+@pytest.fixture
+def app_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+def entry_size(cache):
+    return os.path.getsize(next(cache.cache_dir.glob("*.json")))
+
+
+def test_running_size_tracks_writes_and_deletes(app_dir):
+    cache = DiskCache("test", max_bytes=10**6)
+    cache.set("a", {"value": "x" * 100})
+    cache.set("b", {"value": "x" * 100})
+    cache.set("a", {"value": "x" * 10})
+    cache.delete("b")
+
+    on_disk = sum(p.stat().st_size for p in cache.cache_dir.glob("*.json"))
+    assert cache.size() == on_disk
+
+
+def test_eviction_trims_least_recently_used_below_the_budget(app_dir):
+    cache = DiskCache("test", max_bytes=10**6)
+    cache.set("probe", {"value": "x" * 1000})
+    size = entry_size(cache)
+    cache.delete("probe")
+
+    cache.max_bytes = size * 10
+    for i in range(10):
+        cache.set(f"k{i}", {"value": "x" * 1000})
+        os.utime(cache._path(f"k{i}"), (i, i))
+    assert cache.get("k0") is not None  # touching k0 makes it the most recent
+    cache.set("k10", {"value": "x" * 1000})
+
+    assert cache.size() <= cache.max_bytes * CACHE_EVICT_RATIO
+    assert cache.get("k0") is not None
+    assert cache.get("k1") is None
+    assert cache.get("k10") is not None
@@ -0,0 +1,29 @@
+import multiprocessing
+
+from src.server import metrics
+
+PROCESSES = 8
+
+
+def save_one_request():
+    data = metrics.empty()
+    data["endpoints"]["GET /"] = {"requests": 1, "bytes": 10, "errors": 0}
+    metrics._current = data
+    metrics.save()
+
+
+def test_concurrent_saves_keep_every_process(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=save_one_request) for _ in range(PROCESSES)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    data = metrics.load()
+    assert data["invocations"] == PROCESSES
+    assert data["endpoints"]["GET /"]["requests"] == PROCESSES
+    assert not list(metrics.metrics_file().parent.glob("metrics.json.*"))
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+import typer
+
+from src.commands import sync as sync_command
+from src.server import auth, solution_manager
+from src.server.cache import QuestionCache
+from src.server.catalog import ProblemCatalog
+from src.server.config import CACHE_EVICT_RATIO
+from src.server.solution_manager import SolutionManager
+
+SLUGS = [f"problem-{i}" for i in range(20)]
+
+
+class FakeAuth:
+    is_authenticated = True
+
+    def get_session(self):
+        return None
+
+
+@pytest.fixture(autouse=True)
+def stubs(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(auth, "Auth", FakeAuth)
+    index = {
+        "by_slug": {slug: {"paid_only": False, "difficulty": "Easy"} for slug in SLUGS}
+    }
+    monkeypatch.setattr(ProblemCatalog, "ensure", lambda self, session: index)
+
+    def get_question_data(self, slug, refresh=False):
+        question = {"titleSlug": slug, "content": "x" * 1000}
+        self.question_cache.set(slug, question)
+        return {"data": {"question": question}}
+
+    monkeypatch.setattr(SolutionManager, "get_question_data", get_question_data)
+
+
+def run_sync(**options):
+    flags = dict(
+        difficulty=None,
+        tag=None,
+        workers=1,
+        include_paid=False,
+        refresh=False,
+        restart=False,
+    )
+    flags.update(options)
+    sync_command.sync(**flags)
+
+
+def test_sync_stops_at_the_cache_budget_without_evicting(monkeypatch):
+    # Each entry is a little over 1KB, so only a handful fit the budget
+    monkeypatch.setattr(
+        solution_manager, "QuestionCache", lambda: QuestionCache(max_bytes=8 * 1024)
+    )
+
+    with pytest.raises(typer.Exit) as exit_info:
+        run_sync()
+    assert exit_info.value.exit_code == 1
+
+    manager = SolutionManager(None)
+    store = manager.question_cache.store
+    cached = [slug for slug in SLUGS if manager.question_cache.get(slug)]
+    assert 0 < len(cached) < len(SLUGS)
+    assert cached == SLUGS[: len(cached)]  # nothing fetched was evicted
+    assert store.max_bytes * CACHE_EVICT_RATIO < store.size() <= store.max_bytes
+
+    checkpoint_file = manager.catalog.config_dir / "sync_checkpoint.json"
+    with open(checkpoint_file) as f:
+        assert json.load(f)["done"] == sorted(cached)
+
+
+def test_sync_within_the_budget_clears_the_checkpoint():
+    run_sync()
+
+    manager = SolutionManager(None)
+    assert all(manager.question_cache.get(slug) for slug in SLUGS)
+    assert not (manager.catalog.config_dir / "sync_checkpoint.json").exists()
@@ -0,0 +1,100 @@
+import pytest
+
+from src.commands import test as test_command
+from src.server import auth, file_watcher, solution_manager
+
+SOLUTION = (
+    "class Solution:\n    def twoSum(self, nums, target):\n        return [0, 1]\n"
+)
+
+
+class FakeAuth:
+    is_authenticated = True
+
+    def get_session(self):
+        return None
+
+
+class FakeSolutionManager:
+    def __init__(self, session):
+        self.calls = []
+        FakeSolutionManager.instance = self
+
+    def test_solution(self, problem, code, lang, **kwargs):
+        self.calls.append((problem, code, lang, kwargs))
+        return {"success": True, "state": "SUCCESS", "status_code": 10}
+
+
+class StopAfterFirstRun:
+    """A `changed` event that is never set and interrupts the first wait"""
+
+    def clear(self):
+        pass
+
+    def is_set(self):
+        return False
+
+    def wait(self, timeout=None):
+        raise KeyboardInterrupt
+
+
+class FakeWatcher:
+    def __init__(self, path):
+        self.path = path
+        self.changed = StopAfterFirstRun()
+        self.started = self.stopped = False
+        FakeWatcher.instance = self
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture(autouse=True)
+def stubs(monkeypatch):
+    monkeypatch.setattr(auth, "Auth", FakeAuth)
+    monkeypatch.setattr(solution_manager, "SolutionManager", FakeSolutionManager)
+    monkeypatch.setattr(file_watcher, "FileWatcher", FakeWatcher)
+
+
+def run_test(tmp_path, **options):
+    file = tmp_path / "two-sum.py"
+    file.write_text(SOLUTION)
+    flags = dict(
+        local=False,
+        mem=False,
+        complexity=False,
+        strict=False,
+        no_cache=False,
+        watch=False,
+    )
+    flags.update(options)
+    test_command.test("two-sum", file, **flags)
+    return file
+
+
+def test_watch_tests_the_file_until_interrupted(tmp_path):
+    file = run_test(tmp_path, watch=True, no_cache=True)
+
+    watcher = FakeWatcher.instance
+    assert watcher.path == str(file)
+    assert watcher.started and watcher.stopped
+    [(problem, code, lang, kwargs)] = FakeSolutionManager.instance.calls
+    assert (problem, code, lang) == ("two-sum", SOLUTION, "python3")
+    assert kwargs == {"use_cache": False, "cancel": watcher.changed}
+
+
+def test_watch_passes_local_flags_through(tmp_path, monkeypatch):
+    local_runs = []
+
+    def run_locally(manager, problem, code, lang, strict=False):
+        local_runs.append(strict)
+        return True
+
+    monkeypatch.setattr(test_command, "_run_locally", run_locally)
+    run_test(tmp_path, watch=True, local=True, strict=True)
+
+    assert local_runs == [True]
+    assert len(FakeSolutionManager.instance.calls) == 1